@@ -106,19 +106,10 @@ def GridToLatLong(strMaidenHead):
 #*------------------------------------------------------------------------------------------------------
 #* Transform band into a line of a pre-defined colour
 #*------------------------------------------------------------------------------------------------------
-def band2color(band):
+_BAND_COLOR = {"40m":'c', "20m":'y', "15m":'g', "10m":'m'}
 
-    match band:
-        case "40m":
-            return 'c'
-        case "20m":
-            return 'y'
-        case "15m":
-            return 'g'
-        case "10m":
-            return 'm'
-        case _:
-            return 'c'
+def band2color(band):
+    return _BAND_COLOR.get(band, 'c')
 #*------------------------------------------------------------------------------------------------------
 #* Draw a line in the map given initial and ending coordinates expressed as Maindenhead locator
 #*------------------------------------------------------------------------------------------------------
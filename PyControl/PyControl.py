@@ -29,12 +29,20 @@ separation of presentation and logic, basic error handling and type hints.
 
 
 import sys
+import os
+import functools
+import itertools
+import logging
+import operator
+import threading
 import types
+import weakref
+import tempfile
 from pathlib import Path
-import argparse
-import importlib.util
 from typing import Any
 
+# diagnostics go thru logging; debug records are only formatted with --verbose
+log = logging.getLogger("pycontrol")
 
 
 PM_SPLITON = 0x00008000
@@ -58,13 +66,20 @@ PM_VFOSWAP = 0x00004000;
 PM_RX      = 0x00200000;
 PM_TX      = 0x00400000;
 
+# mode bits of the OmniRig Mode property and the name shown for each one (see getMode)
+_MODE_MASK = 0xfff00000
+_MODE_MAP = {PM_CW_U: "CW-U", PM_CW_L: "CW-L", PM_USB: "USB", PM_LSB: "LSB",
+             PM_DIG_U: "DIG-U", PM_DIG_L: "DIG-L", PM_AM: "AM", PM_FM: "FM"}
+# reverse map for setMode; the selector's plain "CW" means CW-U
+_MODE_FROM_STR = {name: mode for mode, name in _MODE_MAP.items()}
+_MODE_FROM_STR["CW"] = PM_CW_U
+
 
 try:
    import pythoncom
    import win32com.client
    omni=None
    win=None
-   mutex=None
    power_enable_cb=None
    volume_enable_cb=None
    left_enable_cb=None
@@ -88,84 +103,148 @@ try:
    rb_vfoa=None
    rb_vfob=None
 except:
-   print("Not a Win32 environment, dependencies not satisfied, only GUI evaluation mode")
+   log.warning("Not a Win32 environment, dependencies not satisfied, only GUI evaluation mode")
 
 
 # Allow running on Linux/headless systems by passing --linux; when present
-# create proper dummy module objects for pythoncom and win32com.client so
-# importing PyMeter.py does not fail. If --linux is provided it will be
-# removed from sys.argv so later argument parsing works normally.
-linux_flag = '--linux' in sys.argv
-if linux_flag:
-    try:
-        sys.argv.remove('--linux')
-    except ValueError:
+# a meta path finder serves dummy pythoncom / win32com / win32com.client
+# modules the first time they are imported, so importing PyMeter.py does not
+# fail. If --linux is provided it will be removed from sys.argv so later
+# argument parsing works normally.
+class _StubLoader:
+    """Loader building the dummy COM modules used in --linux mode."""
+
+    @staticmethod
+    def _dispatch_with_events(*a, **k):
+        # return dummy object with minimal Rig placeholders
+        return types.SimpleNamespace(Rig1=types.SimpleNamespace(), Rig2=types.SimpleNamespace())
+
+    def create_module(self, spec):
+        mod = types.ModuleType(spec.name)
+        if spec.name == 'pythoncom':
+            mod.Empty = None
+            mod.PumpWaitingMessages = lambda: None
+            mod.CoInitialize = lambda: None
+        elif spec.name == 'win32com':
+            mod.__path__ = []
+        else:
+            mod.DispatchWithEvents = self._dispatch_with_events
+        return mod
+
+    def exec_module(self, module):
         pass
 
-    from types import ModuleType
 
-    if 'pythoncom' not in sys.modules:
-        mod = ModuleType('pythoncom')
-        mod.Empty = None
-        mod.PumpWaitingMessages = lambda: None
-        mod.CoInitialize = lambda: None
-        sys.modules['pythoncom'] = mod
+class _StubFinder:
+    """Meta path finder resolving the COM modules to _StubLoader stubs."""
 
-    if 'win32com' not in sys.modules:
-        winmod = ModuleType('win32com')
-        clientmod = ModuleType('win32com.client')
+    _NAMES = frozenset(('pythoncom', 'win32com', 'win32com.client'))
 
-        def _dispatch_with_events(*a, **k):
-            # return dummy object with minimal Rig placeholders
-            from types import SimpleNamespace
+    def find_spec(self, name, path, target=None):
+        if name in self._NAMES:
+            import importlib.util
+            return importlib.util.spec_from_loader(name, _StubLoader())
+        return None
 
-            return SimpleNamespace(Rig1=SimpleNamespace(), Rig2=SimpleNamespace())
 
-        clientmod.DispatchWithEvents = _dispatch_with_events
-        # register both package and submodule
-        sys.modules['win32com'] = winmod
-        sys.modules['win32com.client'] = clientmod
+linux_flag = '--linux' in sys.argv
+if linux_flag:
+    try:
+        sys.argv.remove('--linux')
+    except ValueError:
+        pass
+    # ahead of the path finders so the stubs win over any installed pywin32
+    sys.meta_path.insert(0, _StubFinder())
 
 
-else:
-    # do not inject dummies; allow real win32com/pythoncom to be used on Windows
-    pass
+#*------------------------------------------------------------------------------------
+#* Active rig cache
+#*------------------------------------------------------------------------------------
+# COM property reads cross an apartment boundary; the selected rig object and the
+# RigType of both rigs are cached here and refreshed only when the rig selection
+# changes or OmniRig reports a rig type / status change.
+_active_rig = None
+_active_index = 0          # row of the selected rig (0 -> Rig1), see win._rigs
+_active_rig_type = ""
+_rig_types = ["", ""]
+# only the FT-2000 answers the RM meter query (see updateMeter)
+_meter_supported = False
+
+# OmniRig is reached both from the GUI handlers and from the event sink; every
+# COM property access and custom command goes thru _com_lock. Reentrant because
+# an outgoing call from the STA pumps messages and may dispatch an event (which
+# takes the lock again) on the same thread.
+_com_lock = threading.RLock()
+
+def _refresh_active_rig():
+    global _active_rig, _active_index, _active_rig_type, _meter_supported
+    radio = getattr(globals().get("win"), "rig1_radio", None)
+    if radio is None:          # event delivered while the window is still being built
+       return
+    sel = _active_index = 0 if radio.isChecked() else 1
+    if linux_flag:
+       return
+    try:
+       with _com_lock:
+          _rig_types[0] = omni.Rig1.RigType
+          _rig_types[1] = omni.Rig2.RigType
+          _active_rig = omni.Rig2 if sel else omni.Rig1
+       _active_rig_type = _rig_types[sel]
+       _meter_supported = _active_rig_type == "FT-2000"
+    except Exception as e:
+       log.warning("_refresh_active_rig() exception %s", e)
 
 
 
 #*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=
 #*------------------------------------------------------------------------------------
-#* Set Vfo A or B
+#* Send a custom CAT command thru OmniRig
 #*------------------------------------------------------------------------------------
-    def SendCAT(rig, command_str,reply_length,reply_end):
-                
-       global linux_flag,omni,win
-       if linux_flag:
-          print("Running on a non-Windows environment, skip CAT thru OmniRig")
-          return
-       if rig.RigType != "FT-2000":
-          print(f"Custom commands not supported for rigs other than FT-2000")
-          return
-
-    # Convert command to bytes
-
-       command_bytes = command_str.encode("ascii")
-       cmd_sent=command_bytes;
-       #print(f"(SendCAT) Sending command ({command_bytes})")
-       rig.SendCustomCommand(command_bytes, reply_length, reply_end)
-
-       try:
-          while True:
-              pythoncom.PumpWaitingMessages()
-              if reply_length == 0:
-                 print(f"CMD[{cmd_sent}] --> ANSWER[{command_bytes}]")
- 
-              #print(f"{command_bytes}")
-              if cmd_sent != command_bytes:            
-                 print(f"CMD[{cmd_sent}] --> ANSWER[{command_bytes}]")
-              return
-       except KeyboardInterrupt:
-          print("\nKeyboard interrupt received, aborting...")
+# Replies arrive asynchronously thru OmniRigEvents.OnCustomReply; SendCAT only drains
+# the messages already queued and, when a reply is expected, pumps for a bounded time.
+CAT_PUMP_ROUNDS = 5
+CAT_PUMP_WAIT_MS = 20
+
+# FT-2000 CAT commands, built once as bytes so the hot paths skip formatting/encoding
+_VOL_CMD = tuple(f"AG0{v:03d};".encode("ascii") for v in range(256))
+_PWR_CMD = tuple(f"PC{v:03d};".encode("ascii") for v in range(256))
+_CMD_ANT = {"ANT 1": b"AN01;", "ANT 2": b"AN02;"}
+_BTN_CMD = {"VOL": _VOL_CMD, "PWR": _PWR_CMD}
+_CMD_TUNE = b"AC002;"
+_CMD_MUTE_OFF = b"AG0030;"
+_CMD_MUTE_ON = b"AG0000;"
+_CMD_RM_SWR = b"RM6;"
+_CMD_RM_POWER = b"RM5;"
+_CMD_RM_SIGNAL = b"RM1;"
+
+def SendCAT(rig, command_str,reply_length,reply_end):
+
+   if linux_flag:
+      log.debug("Running on a non-Windows environment, skip CAT thru OmniRig")
+      return
+   # the cached type saves a COM read for the usual case (the selected rig)
+   if rig is _active_rig:
+      rig_type = _active_rig_type
+   else:
+      with _com_lock:
+         rig_type = rig.RigType
+   if rig_type != "FT-2000":
+      log.debug("Custom commands not supported for rigs other than FT-2000")
+      return
+
+   command_bytes = command_str if isinstance(command_str, bytes) else command_str.encode("ascii")
+   with _com_lock:
+      rig.SendCustomCommand(command_bytes, reply_length, reply_end)
+
+   pythoncom.PumpWaitingMessages()
+   if reply_length == 0:
+      log.debug("CMD[%s]", command_bytes)
+      return
+
+   import win32event
+   for _ in range(CAT_PUMP_ROUNDS):
+      win32event.MsgWaitForMultipleObjects([], 0, CAT_PUMP_WAIT_MS, win32event.QS_ALLINPUT)
+      pythoncom.PumpWaitingMessages()
 
 
 #*------------------------------------------------------------------------------------
@@ -173,13 +252,14 @@ else:
 #*------------------------------------------------------------------------------------
 def setVfo(rig,mVfo):
 
-    global omni, win,mutex,power_enable_cb,volume_enable_cb,left_enable_cb,mid_enable_cb,right_enable_cb,tr_cb,mute_cb,split_cb,tune_cb,splitState
 
     try:
        if linux_flag:
           return 
 
-       if rig.RigType == "FT-2000":
+       with _com_lock:
+          rig_type = rig.RigType
+       if rig_type == "FT-2000":
 
           if mVfo == "VFO A":       # FT-2000 produces strange effects
              #rig.Vfo = PM_VFOAA    # when the VFO is changed with OmniRig
@@ -190,105 +270,82 @@ def setVfo(rig,mVfo):
        else:
     
           if mVfo == "VFO A":
-             rig.Vfo = PM_VFOA
+             with _com_lock:
+                rig.Vfo = PM_VFOA
              return
           if mVfo == "VFO B":
-             rig.Vfo = PM_VFOB
+             with _com_lock:
+                rig.Vfo = PM_VFOB
              return
 
     except Exception as e:
-       print(f"setVfo() exception {e}")
+       log.warning("setVfo() exception %s", e)
        pass
-    print(f"ERROR. Invalid VFO code given. Ignored")
+    log.warning("ERROR. Invalid VFO code given. Ignored")
     return 
 
 def setVUMeter(txt):
-    global omni, win,mutex,power_enable_cb,volume_enable_cb,left_enable_cb,mid_enable_cb,right_enable_cb,tr_cb,mute_cb,split_cb,tune_cb,splitState,tune,mute,rb_swr,rb_power,rb_signal,rb_none
-
     try:
        if linux_flag:
           return 0
     
-       if win.rig1_radio.isChecked():
-          rig=omni.Rig1
-       else:
-          rig=omni.Rig2
-
-       if rig.RigType != "FT-2000":
-          print(f"Command to setVUMeter() not available with {rig.RigType}")
+       rig=_active_rig
+       if _active_rig_type != "FT-2000":
+          log.debug("Command to setVUMeter() not available with %s", _active_rig_type)
           return 0
 
        meter.set_value(0)
 
     except Exception as e:
-       print(f"setVUMeter() exception {e}")
+       log.warning("setVUMeter() exception %s", e)
        pass
     return txt
 
 def updateMeter():
-    global omni, win,mutex,power_enable_cb,volume_enable_cb,left_enable_cb,mid_enable_cb,right_enable_cb,tr_cb,mute_cb,split_cb,tune_cb,splitState,tune,mute,rb_swr,rb_power,rb_signal,rb_none
-
     try:
-       if linux_flag:
-          return 0
-    
-       if win.rig1_radio.isChecked():
-          rig=omni.Rig1
-       else:
-          rig=omni.Rig2
-
-       if rig.RigType != "FT-2000":
+       # no RM query for rigs without it or while the meter cannot be seen
+       if linux_flag or not _meter_supported or not meter.isVisible() or meter.window().isMinimized():
           return 0
 
-       cmd = ""
+       rig=_active_rig
+       cmd = b""
 
        if rb_swr.isChecked():
-          cmd= "RM6;"
+          cmd = _CMD_RM_SWR
        if rb_power.isChecked():
-          cmd= "RM5;"
+          cmd = _CMD_RM_POWER
        if rb_signal.isChecked():
-          cmd= "RM1;"
+          cmd = _CMD_RM_SIGNAL
 
 
-       if cmd  !=  "":
-          print(f"updateMeter() request {cmd} sent to {rig.RigType}")
+       if cmd:
+          log.debug("updateMeter() request %s sent to %s", cmd, _active_rig_type)
           SendCAT(rig,cmd,0,";")
 
     except Exception as e:
-       print(f"updateMeter() exception {e}")
+       log.warning("updateMeter() exception %s", e)
        pass
     return 0
 
 def setAntenna(txt):
 
-    global omni, win,mutex,power_enable_cb,volume_enable_cb,left_enable_cb,mid_enable_cb,right_enable_cb,tr_cb,mute_cb,split_cb,tune_cb,splitState,tune,mute
 
     try:
        if linux_flag:
-          return val
-       if win.rig1_radio.isChecked():
-          rig=omni.Rig1
-       else:
-          rig=omni.Rig2
-
-       if rig.RigType != "FT-2000":
-          print(f"Command to set {txt} not available with {rig.RigType}")
-          return val
-
-       print(f"Selected {txt})")
-
-       cmd = ""
-       if txt.upper() == "ANT 1":
-          cmd=f"AN01;"
+          return txt
+       rig=_active_rig
+       if _active_rig_type != "FT-2000":
+          log.debug("Command to set %s not available with %s", txt, _active_rig_type)
+          return txt
 
-       if txt.upper() == "ANT 2":
-          cmd=f"AN02;"
+       log.debug("Selected %s)", txt)
 
-       if cmd  !=  "":
+       cmd = _CMD_ANT.get(txt.upper())
+       if cmd:
           SendCAT(rig,cmd,0,";")
 
     except Exception as e:
-       print(f"setAntenna() exception {e}")
+       log.warning("setAntenna() exception %s", e)
        pass
     return txt
 
@@ -296,17 +353,12 @@ def setAntenna(txt):
 #* set state of push
 #*------------------------------------------------------------------------------------
 def setButton(strButton,val):
-    global omni, win,mutex,power_enable_cb,volume_enable_cb,left_enable_cb,mid_enable_cb,right_enable_cb,tr_cb,mute_cb,split_cb,tune_cb,splitState,tune,mute
     try:
        if linux_flag:
           return val
-       if win.rig1_radio.isChecked():
-          rig=omni.Rig1
-       else:
-          rig=omni.Rig2
-
-       if rig.RigType != "FT-2000":
-          print(f"Command to set {strButton} not available with {rig.RigType}")
+       rig=_active_rig
+       if _active_rig_type != "FT-2000":
+          log.debug("Command to set %s not available with %s", strButton, _active_rig_type)
           return val
 
        if val < 0:
@@ -314,20 +366,15 @@ def setButton(strButton,val):
        if val > 255:
           val = 255
 
-       print(f"Set {strButton} to level({val})")
-
-       cmd = ""
-       if strButton.upper() == "VOL":
-          cmd=f"AG0{val:0{3}d};"
+       log.debug("Set %s to level(%s)", strButton, val)
 
-       if strButton.upper() == "PWR":
-          cmd=f"PC{val:0{3}d};"
-
-       if cmd  !=  "":
+       table = _BTN_CMD.get(strButton.upper())
+       if table is not None:
+          cmd = table[val]
           SendCAT(rig,cmd,0,";")
 
     except Exception as e:
-       print(f"setButton() exception {e}")
+       log.warning("setButton() exception %s", e)
        pass
     return val
 
@@ -335,77 +382,66 @@ def setButton(strButton,val):
 #* set state of push
 #*------------------------------------------------------------------------------------
 def pushMode(rig,m):
-    global omni, win,mutex,power_enable_cb,volume_enable_cb,left_enable_cb,mid_enable_cb,right_enable_cb,tr_cb,mute_cb,split_cb,tune_cb,splitState,tune,mute,tr
     try:
        if linux_flag:
           return m
        setMode(rig,m)
-       if rig1_radio.isChecked():
-          rig1_mode.setText(m)
-       else:
-          rig2_mode.setText(m)
+       _set_text(win._rigs[_active_index].mode, m)
        return m
 
     except Exception as e:
-       print(f"setPush() exception {e}")
+       log.warning("pushMode() exception %s", e)
        pass
     return m
 
 
+#*------------------------------------------------------------------------------------
+#* push button actions (FT-2000 only), dispatched by button name from setPush
+#*------------------------------------------------------------------------------------
+def _push_tune(rig):
+   tune._led.set_on(True)
+   SendCAT(rig,_CMD_TUNE,0,";")
+
+def _push_tr(rig):
+   if tr.get_state() == 0:
+      tr.set_state(1)
+      tr._button.setText('TX')
+      tr._led.set_on(True)
+      with _com_lock:
+         rig.Tx=PM_TX
+   else:
+      tr.set_state(0)
+      tr._button.setText('RX')
+      tr._led.set_on(False)
+      with _com_lock:
+         rig.Tx=PM_RX
+
+def _push_mute(rig):
+   muted = mute._led.is_on()
+   SendCAT(rig,_CMD_MUTE_OFF if muted else _CMD_MUTE_ON,0,";")
+   mute._led.set_on(not muted)
+
+# "Split" has no push action, the per-rig split checkboxes handle it
+_PUSH_HANDLERS = {"Tune": _push_tune, "RX": _push_tr, "TX": _push_tr, "Mute": _push_mute}
+
 def setPush(rig,n):
-    global omni, win,mutex,power_enable_cb,volume_enable_cb,left_enable_cb,mid_enable_cb,right_enable_cb,tr_cb,mute_cb,split_cb,tune_cb,splitState,tune,mute,tr
     try:
        if linux_flag:
           return n
-
-       if n=="Split":
+       handler = _PUSH_HANDLERS.get(n)
+       if handler is None:
           return n
-          #print(f"Split button pressed checked({splitState})")
-
-       if n=="Tune":
-          #print(f"Tune button pressed checked({splitState})")
-          if rig.RigType == "FT-2000":
-             cmd="AC002;"
-             tune._led.set_on(True)
-             SendCAT(rig,cmd,0,";")
-
-       if n=="RX" or n=="TX":
-
-       # Get a list of methods using dir()
-          if rig.RigType == "FT-2000":
-             #print(f"RIG 1 AND FT-2000 msg{n} status {tr._led.is_on()}) state({tr.get_state()})")
-             if tr.get_state() == 0:
-                tr.set_state(1)
-                tr._button.setText('TX')
-                tr._led.set_on(True)
-                rig.Tx=PM_TX
-             else:
-                tr.set_state(0)
-                tr._button.setText('RX')
-                tr._led.set_on(False)
-                rig.Tx=PM_RX
-
-       if n=="Mute":
-          #print(f"Tune button pressed checked({splitState})")
-          if rig.RigType == "FT-2000":
-             if mute._led.is_on():
-                cmd="AG0030;"
-             else:
-                cmd="AG0000;"
-             #print(f"Mute [AFTER] LED State({mute._led.is_on()})")
-             SendCAT(rig,cmd,0,";")
-             if mute._led.is_on():
-                mute._led.set_on(False)
-             else:
-                mute._led.set_on(True)
+       with _com_lock:
+          rig_type = rig.RigType
+       if rig_type == "FT-2000":
+          handler(rig)
        return n
     except Exception as e:
-       print(f"setPush() exception {e}")
+       log.warning("setPush() exception %s", e)
        pass
     return n
 
 def updateSplit():
-    global omni, win,mutex,power_enable_cb,volume_enable_cb,left_enable_cb,mid_enable_cb,right_enable_cb,tr_cb,mute_cb,split_cb,tune_cb,rig1_split_cb,rig2_split_cb
     if linux_flag:
        return
 """
@@ -421,61 +457,34 @@ def updateSplit():
        else:
           omni.Rig2.Split=PM_SPLITOFF
     except Exception as e:
-       print(f"updateSplit() exception {e}")
+       log.warning("updateSplit() exception %s", e)
        pass
 """
+def _read_rig(n, rig):
+    """Snapshot (freq, mode, status) of rig n (0 -> Rig1) while holding _com_lock."""
+    with _com_lock:
+       if _rig_types[n] == "FT-2000" and n == _active_index:
+          freq = rig.FreqA if rb_vfoa.isChecked() else rig.FreqB
+       else:
+          freq = rig.Freq
+       return int(freq), rig.Mode, rig.StatusStr
+
 def updateStatus():
-    global omni, win,mutex,power_enable_cb,volume_enable_cb,left_enable_cb,mid_enable_cb,right_enable_cb,tr_cb,mute_cb,split_cb,tune_cb,rig1_split_cb,rig2_split_cb,rb_vfoa,rb_vfob
     if linux_flag:
        return
     try:
-       rig1=omni.Rig1
-       rig2=omni.Rig2
-
-       win.rig1_name.setText(rig1.RigType)
-
-       if rig1.RigType != "FT-2000":
-          win.rig1_freq_label.setText(str(rig1.Freq))
-       else:
-          if win.rig1_radio.isChecked():
-             if rb_vfoa.isChecked():
-                win.rig1_freq_label.setText(str(rig1.FreqA))
-             else:
-                win.rig1_freq_label.setText(str(rig1.FreqB))
-          else:
-             win.rig1_freq_label.setText(str(rig1.Freq))
-
-
-       win.rig1_mode.setText(getMode(rig1.Mode))
-
-       if rig1.StatusStr == "On-line":
-          win.rig1_led.set_on(True)
-       else:
-          win.rig1_led.set_on(False)
-
-       win.rig2_name.setText(rig2.RigType)
-       
-       if rig2.RigType != "FT-2000":
-          win.rig2_freq_label.setText(str(rig2.Freq))
-       else:
-          if win.rig2_radio.isChecked():
-             if rb_vfoa.isChecked():
-                win.rig2_freq_label.setText(str(rig2.FreqA))
-             else:
-                win.rig2_freq_label.setText(str(rig2.FreqB))
-          else:
-             win.rig2_freq_label.setText(str(rig2.Freq))
-
-
-
-       win.rig2_mode.setText(getMode(rig2.Mode))
-
-       if rig2.StatusStr == "On-line":
-          win.rig2_led.set_on(True)
-       else:
-          win.rig2_led.set_on(False)
-
-       if (rig1.RigType == "FT-2000" and win.rig1_radio.isChecked()) or (rig2.RigType == "FT-2000" and win.rig2_radio.isChecked()):
+       with _com_lock:
+          rigs = (omni.Rig1, omni.Rig2)
+
+       # COM reads are done under the lock, the widgets are updated after it
+       for n, row in enumerate(win._rigs):
+          freq, mode, status = _read_rig(n, rigs[n])
+          _set_text(row.name, _rig_types[n])
+          _set_freq(row.freq, freq)
+          _set_text(row.mode, getMode(mode))
+          row.led.set_on(status == "On-line")
+
+       if _active_rig_type == "FT-2000":
              power_enable_cb.setChecked(True)
              volume_enable_cb.setChecked(True)
              right_enable_cb.setChecked(False)    # *Temporary* while a fix is found for the VFOA/B issue 
@@ -501,9 +510,34 @@ def updateStatus():
 
 
     except Exception as e:
-       print(f"updateStatus() exception {e}")
+       log.warning("updateStatus() exception %s", e)
        pass
 
+#*------------------------------------------------------------------------------------
+#* Coalesced status refresh
+#*------------------------------------------------------------------------------------
+# OmniRig can fire several params/status events in a row (e.g. while tuning);
+# they only mark the status dirty and arm a short single-shot timer, so a burst
+# results in a single updateStatus() pass. While the window is hidden or
+# minimized the flag is only kept and the refresh runs when it is shown again.
+_status_dirty = True
+
+def _win_shown():
+    return win is not None and win.isVisible() and not win.isMinimized()
+
+def _request_status():
+    global _status_dirty
+    _status_dirty = True
+    t = getattr(win, '_status_timer', None)
+    if t is not None and not t.isActive() and _win_shown():
+       t.start()
+
+def _flush_status():
+    global _status_dirty
+    if _status_dirty and _win_shown():
+       _status_dirty = False
+       updateStatus()
+
 #*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=
 """
 OmniRigEvents
@@ -519,7 +553,7 @@ class OmniRigEvents:
 
 
    def __init__(self) -> None:
-       print("[OmniRigEvents] Omnirig engine initialization completed")
+       log.info("[OmniRigEvents] Omnirig engine initialization completed")
 
 
 
@@ -527,24 +561,25 @@ class OmniRigEvents:
 
    def OnCustomReply(self,RigNumber=defaultNamedNotOptArg,Command=defaultNamedNotOptArg,Reply=defaultNamedNotOptArg):
 
-       global omni,linux_flag,tune,meter,rb_swr,rb_power,rb_signal,rb_none
        if linux_flag:
           return
 
        """Triggers when a response to a custom command is received."""
        try:
           reply_bytes = bytes(Reply)
-          print(f"[CustomReply] Rig={RigNumber} Cmd={bytes(Command)} Reply={reply_bytes!r}")
-
-          reply=reply_bytes.decode('utf-8').upper()
-          if reply[:2] == "RM":
-             if len(reply)>6:
-                indicator=int(reply[2])
-                level=int(f"{int(reply[3:6]):0{3}d}")
-                print(f"Updating meter with {indicator} value({level})")
-                meter.set_value(int(level))
+          log.debug("[CustomReply] Rig=%s Cmd=%r Reply=%r", RigNumber, Command, reply_bytes)
+
+          # ASCII reply, RM<indicator><level:3>; -- int() parses the bytes directly
+          if reply_bytes[:2] in (b"RM", b"rm"):
+             if len(reply_bytes)>6:
+                indicator=reply_bytes[2] - 48
+                level=int(reply_bytes[3:6])
+                log.debug("Updating meter with %s value(%s)", indicator, level)
+                # called from the COM apartment; queue the update on the GUI thread
+                from PyQt5.QtCore import QMetaObject, Qt, Q_ARG
+                QMetaObject.invokeMethod(meter, "set_value", Qt.QueuedConnection, Q_ARG(int, level))
        except Exception as e:
-          print(f"[CustomReply] exception {e}")
+          log.warning("[CustomReply] exception %s", e)
           reply_bytes=""
 
        except TypeError:
@@ -554,86 +589,526 @@ class OmniRigEvents:
    #*--- Response to a change in the visible condition of the Omnirig's settings dialog
 
    def OnVisibleChange(self, RigNumber):
-        global linux_flag,win
         if linux_flag:
            return
-        updateStatus()
-        print(f"[EVENT] VisibleChangeEvent: rig={RigNumber}", flush=True)
+        log.debug("[EVENT] VisibleChangeEvent: rig=%s", RigNumber)
 
    #*--- Change the rig type
 
    def OnRigTypeChange(self, RigNumber):
-        global linux_flag,win
         if linux_flag:
            return
-        updateStatus()
+        _refresh_active_rig()
+        _request_status()
         win.tune._led.set_on(False)
 
-        print(f"[EVENT] RigTypeChangeEvent: rig={RigNumber}", flush=True)
+        log.debug("[EVENT] RigTypeChangeEvent: rig=%s", RigNumber)
 
    #*--- Change the rig status
 
    def OnStatusChange(self, RigNumber):
-        global mutex,linux_flag,win
         if linux_flag:
            return
         try:
             rig = omni.Rig1 if RigNumber == 1 else omni.Rig2
             # Get_StatusStr es una propiedad del RigX
-            status = rig.StatusStr
-            print(f"[EVENT] StatusChangeEvent: rig={RigNumber}, status='{status}'",flush=True)
+            with _com_lock:
+               status = rig.StatusStr
+            log.debug("[EVENT] StatusChangeEvent: rig=%s, status='%s'", RigNumber, status)
             if status=="On-line":
-               print(f"[EVENT] OnStatusChange: rig={RigNumber} Freq({rig.Freq}) Mode({getMode(rig.Mode)})", flush=True)
+               if log.isEnabledFor(logging.DEBUG):   # Freq/Mode are COM reads
+                  with _com_lock:
+                     freq, mode = rig.Freq, rig.Mode
+                  log.debug("[EVENT] OnStatusChange: rig=%s Freq(%s) Mode(%s)", RigNumber, freq, getMode(mode))
             else:
-               print(f"{RigNumber} Offline")
-            updateStatus()
+               log.debug("%s Offline", RigNumber)
+            _refresh_active_rig()
+            _request_status()
             win.tune._led.set_on(False)
 
         except Exception as e:
-            print(f"[EVENT] StatusChangeEvent: rig={RigNumber}, error leyendo estado: {e}",flush=True)
-        if mutex==True:
-           mutex=False
+            log.warning("[EVENT] StatusChangeEvent: rig=%s, error leyendo estado: %s", RigNumber, e)
 
    #*--- Change in the parameter of the transceiver
 
    def OnParamsChange(self, RigNumber,e):
 
-        global linux_flag,omni,mutex,win
         if linux_flag:
            return
         try:
             rig = omni.Rig1 if RigNumber == 1 else omni.Rig2
 
             #print(f"[EVENT] ParamsChangeEvent: rig={RigNumber} param:{e:08x} Freq({rig.Freq}) Mode({getMode(rig.Mode)})", flush=True)
-            updateStatus()
+            _request_status()
             win.tune._led.set_on(False)
 
         except Exception as e:
-            print(f"[EVENT] ParamsChangeEvent: rig={RigNumber}, error leyendo params: {e}", flush=True)
+            log.warning("[EVENT] ParamsChangeEvent: rig=%s, error leyendo params: %s", RigNumber, e)
 
 #*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=*=
 
 # Locate the PyMeter.py file in the repository (assumes script lives in PyControl/)
-repo_root = Path(__file__).resolve().parents[1]
+# and the INI file next to this script; __file__ is resolved once per process
+_HERE = Path(__file__).resolve()
+repo_root = _HERE.parents[1]
 pym_path = repo_root / 'PyMeter' / 'PyMeter.py'
-if not pym_path.exists():
-    raise FileNotFoundError(f"PyMeter.py not found at expected location: {pym_path}")
 
-spec = importlib.util.spec_from_file_location('pymeter_module', str(pym_path))
-_pym = importlib.util.module_from_spec(spec)  # type: ignore
-assert spec and spec.loader
-spec.loader.exec_module(_pym)  # type: ignore
+# PyQt5 is imported lazily: build_window imports every Qt name it uses in one
+# block and main() pulls QApplication only after the command line was checked.
+
+# Widget classes taken from the PyMeter module. PyMeter is only imported when
+# one of them is first needed (build_window, or PyControl.<name> from outside).
+_PYM_NAMES = ('VUMeter', 'LedButton', 'LedIndicator', 'TuneButton', 'VFOButton', 'SwapButton')
+_pym_getter = operator.attrgetter(*_PYM_NAMES)
+_pym = None
+
+
+def _load_pymeter():
+    """Import PyMeter once and publish its widget classes as module globals."""
+    global _pym
+    if _pym is not None:
+        return _pym
+    # reuse a PyMeter already imported in this process (tests, plugins, a second
+    # PyControl import) without touching the filesystem or sys.path again
+    mod = sys.modules.get('PyMeter')
+    if mod is None:
+        if not pym_path.exists():
+            raise FileNotFoundError(f"PyMeter.py not found at expected location: {pym_path}")
+        # Regular import through sys.path so the module is cached in sys.modules and
+        # its compiled bytecode (__pycache__) is reused on later runs.
+        pym_dir = str(pym_path.parent)
+        if pym_dir not in sys.path:
+            sys.path.insert(0, pym_dir)
+        import PyMeter as mod
+    # all six resolved in one C call; a missing class raises AttributeError here
+    globals().update(zip(_PYM_NAMES, _pym_getter(mod)))
+    # published last: a non-None _pym means the widget classes are in place
+    _pym = mod
+    return _pym
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the PyMeter widget classes lazily (PEP 562)."""
+    if name in _PYM_NAMES:
+        _load_pymeter()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+#*------------------------------------------------------------------------------------
+#* Configuration persistence (PyControl.ini, one KEY=VALUE per line)
+#*------------------------------------------------------------------------------------
+CFG_DEFAULTS = {
+    'RIG': 'rig1',
+    'LEFT': 'Signal',
+    'ANT': 'ant 1',
+    'VFO': 'VFO A',
+    'MODE': 'CW',
+    'POWER': '0',
+    'VOLUME': '0'
+}
+
+
+def _load_cfg(path: Path) -> dict:
+    """Parse a KEY=VALUE file into a dict, preserving key case.
+
+    Parsed line by line: blank lines, '#' comments and lines without '=' are
+    skipped, so a stray line never costs the other settings.
+    """
+    cfg = {}
+    for line in path.read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith('#') or '=' not in line:
+            continue
+        k, v = line.split('=', 1)
+        cfg[k.strip()] = v.strip()
+    return cfg
+
+
+def _store_cfg(path: Path, cfg: dict) -> None:
+    """Write cfg as KEY=VALUE lines, atomically replacing path."""
+    with tempfile.NamedTemporaryFile('w', dir=path.parent, prefix=path.name, suffix='.tmp', delete=False) as f:
+        f.write(''.join(f"{k}={v}\n" for k, v in cfg.items()))
+    try:
+        os.replace(f.name, path)
+    except OSError:
+        os.unlink(f.name)
+        raise
+
 
-# Import PyQt5 lazily to provide clearer error messages if missing.
-from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel
+#*------------------------------------------------------------------------------------
+#* GUI event handlers, bound to the widgets with functools.partial in build_window
+#*------------------------------------------------------------------------------------
+# Signals are wired only with explicit new-style connects to callables (partials of
+# the handlers below). QMetaObject.connectSlotsByName is never called, so no
+# on_<object>_<signal> naming is relied upon; keep it that way. Every sender and
+# handler lives on the GUI thread, so the connects are Qt.DirectConnection (no
+# per-emit thread check); only OnCustomReply crosses threads, thru a queued call.
+MODE_DEBOUNCE_MS = 50
 
-# Extract commonly used widget classes from PyMeter module (fall back to safe names).
-VUMeter = getattr(_pym, 'VUMeter')
-LedButton = getattr(_pym, 'LedButton')
-LedIndicator = getattr(_pym, 'LedIndicator')
-TuneButton = getattr(_pym, 'TuneButton')
-VFOButton = getattr(_pym, 'VFOButton')
-SwapButton = getattr(_pym, 'SwapButton')
+# Power/Volume sliders are fixed to 0..255; their label texts are built once
+_SLIDER_STRS = tuple(str(i) for i in range(256))
+
+
+def _save_key(win, key: str, value: str) -> None:
+    """Update the cached configuration and (re)arm the deferred INI write."""
+    try:
+        win._cfg_cache[key] = str(value)
+        win._cfg_dirty = True
+        win._cfg_timer.start()
+    except Exception:
+        pass
+
+
+def _on_mode_changed(win, t: str) -> None:
+    # scrolling thru the combo emits one change per item; only the last one is
+    # pushed to the rig once the selector has been idle for MODE_DEBOUNCE_MS
+    win._mode_pending = t
+    win._mode_timer.start()
+
+
+def _apply_mode(win) -> None:
+    t = win._mode_pending
+    try:
+        log.debug("Mode selector changed: %s", pushMode(_active_rig,t))
+        _save_key(win, 'MODE', t)
+    except Exception:
+        pass
+
+
+def _on_rig_split(win, key: str, tag: str, checked: bool) -> None:
+    try:
+        log.debug("%s Split: %s", tag, bool(checked))
+        _save_key(win, key, '1' if checked else '0')
+    except Exception:
+        pass
+
+
+def _on_rig_selected(win, button) -> None:
+    _refresh_active_rig()
+    _request_status()
+    try:
+        sel = 'unknown'
+        for n, row in enumerate(win._rigs, start=1):
+            if row.radio.isChecked():
+                sel = f'rig{n}'
+                split = row.split_cb.isChecked()
+                if not linux_flag:
+                    # _refresh_active_rig() above already resolved the selected rig
+                    with _com_lock:
+                        _active_rig.Split = PM_SPLITON if split else PM_SPLITOFF
+                log.debug("Rig (%s) Split(%s)", _rig_types[n - 1], 'ON' if split else 'OFF')
+                break
+        log.debug("Rig selected: %s", sel)
+
+        _save_key(win, 'RIG', sel)
+    except Exception:
+        pass
+
+
+def _on_slider_change(win, group: str, tag: str, value_label, v: int) -> None:
+    # do nothing if controls are disabled
+    if not win._enabled[group]:
+        return
+    iv = v if 0 <= v <= 255 else max(0, min(255, v))
+    # compare ints (cheaper than a QString round-trip) and skip no-op updates
+    if win._slider_last.get(tag) == iv:
+        return
+    win._slider_last[tag] = iv
+    value_label.setText(_SLIDER_STRS[iv])
+    log.debug("%s slider changed: %s", tag, iv)
+
+
+def _on_slider_set(win, group: str, slider, key: str, code: str, checked: bool = False) -> None:
+    """Send the value of slider to the rig and persist it under key."""
+    try:
+        if not win._enabled[group]:
+            return
+        val = int(slider.value())
+        log.debug("Set button pressed: %s=%s", key.lower(), setButton(code,val))
+        _save_key(win, key, str(val))
+    except Exception:
+        pass
+
+
+def _select_vfo(txt: str) -> str:
+    """Apply a VFO A/B selection to the active rig; returns the text to log."""
+    setVfo(_active_rig, txt)
+    # the displayed frequency depends on the VFO selection
+    _request_status()
+    return f"{txt} (Rig {_active_rig_type})"
+
+
+# labels of the radio groups, indexed by QButtonGroup id
+_LEFT_NAMES = ('SWR', 'Power', 'Signal', 'None')
+_ANT_NAMES = ('ant 1', 'ant 2')
+_VFO_NAMES = ('VFO A', 'VFO B')
+
+
+def _group_click(win, tag: str, key: str, action, names: tuple, idx: int) -> None:
+    """idClicked slot shared by the Left (meter), Antenna and VFO groups.
+
+    action(text) applies the selection names[idx] to the rig and returns what
+    to log; the text is then persisted under key.
+    """
+    txt = names[idx]
+    try:
+        shown = action(txt)
+    except Exception:
+        # rig not reachable (no OmniRig): still log and persist the selection
+        shown = txt
+    log.debug("%s selected: %s", tag, shown)
+    _save_key(win, key, txt)
+
+
+# last value shown per label; weak keys so the caches neither keep labels of a
+# closed window alive nor match a new label that reuses a freed label's id()
+_FREQ_SHOWN = weakref.WeakKeyDictionary()
+_TEXT_SHOWN = weakref.WeakKeyDictionary()
+
+
+def _set_freq(label, hz: int) -> None:
+    """Show hz on a rig frequency label; an unchanged frequency costs neither
+    formatting nor setText."""
+    if _FREQ_SHOWN.get(label) != hz:
+        label.setText(f"{hz:,d} MHz")
+        _FREQ_SHOWN[label] = hz
+
+
+def _set_text(label, s: str) -> None:
+    """setText only when s differs from the last text set thru here on label."""
+    if _TEXT_SHOWN.get(label) != s:
+        label.setText(s)
+        _TEXT_SHOWN[label] = s
+
+
+def _on_enable_state(setter, state: int) -> None:
+    """stateChanged slot of the debug enable checkboxes (2 == Qt.Checked)."""
+    setter(state == 2)
+
+
+def _on_button_event(name: str, checked: bool = False) -> None:
+    """clicked slot of the RX/Mute/Tune buttons, acting on the rig selected at click
+    time (_active_rig is None without OmniRig)."""
+    rig = _active_rig
+    log.debug("Button event: %s", setPush(rig, name) if rig is not None else name)
+
+
+def _set_controls_enabled(win, group: str, checkbox, controls, labels, enabled: bool) -> None:
+    """Enable/disable a group of controls and gray out its labels.
+
+    Shared by the Power/Volume rows and the three radio groups; the state is
+    stored in win._enabled[group] and mirrored on the group's debug checkbox.
+    """
+    en = bool(enabled)
+    win._enabled[group] = en
+    for w in controls:
+        w.setEnabled(en)
+    # gray out text when disabled (palette swap, no stylesheet re-parse)
+    pal = _palettes()[en]
+    for w in labels:
+        w.setPalette(pal)
+    checkbox.setChecked(en)
+
+
+def _set_button_enabled(win, group: str, btn_obj, checkbox, enabled: bool) -> None:
+    """Enable/disable a LED push button together with its debug checkbox; the
+    state is kept in win._enabled[group] like the other control groups."""
+    en = bool(enabled)
+    # update checkbox state
+    checkbox.setChecked(en)
+    # underlying QPushButton
+    qbtn = getattr(btn_obj, '_button', None) or btn_obj
+    qbtn.setEnabled(en)
+    # label style (palette swap, no stylesheet re-parse and re-polish)
+    qbtn.setPalette(_palettes()[en])
+    # led visuals: green on / dim off when enabled, dark gray when disabled
+    led = getattr(btn_obj, '_led', None)
+    if led is not None:
+        color_on, color_off = _btn_led_colors()[en]
+        led.set_color_on(color_on)
+        led.set_color_off(color_off)
+        led.set_on(False)
+    win._enabled[group] = en
+
+
+def _restore_group(group, names: tuple, val: str) -> None:
+    """Check the button whose label (names[id]) is val, emitting no group signals.
+
+    idClicked is never emitted by setChecked(), so blocking the group once
+    is enough; the buttons themselves do not need to be blocked one by one.
+    """
+    if val not in names:
+        return
+    group.blockSignals(True)
+    group.button(names.index(val)).setChecked(True)
+    group.blockSignals(False)
+
+
+# Alignment combinations used by the layouts; Qt is imported lazily, so they are
+# computed once by _init_align() when the first window is built.
+_ALIGN_NONE = _ALIGN_C = _ALIGN_LV = _ALIGN_RV = _ALIGN_HV = None
+
+# contents margins of the control rows (left, top, right, bottom)
+_ROW_MARGINS = (0, 4, 0, 4)
+
+
+def _init_align() -> None:
+    global _ALIGN_NONE, _ALIGN_C, _ALIGN_LV, _ALIGN_RV, _ALIGN_HV
+    if _ALIGN_NONE is None:
+        from PyQt5.QtCore import Qt
+        _ALIGN_NONE = Qt.Alignment()
+        _ALIGN_C = Qt.AlignCenter
+        _ALIGN_LV = Qt.AlignLeft | Qt.AlignVCenter
+        _ALIGN_RV = Qt.AlignRight | Qt.AlignVCenter
+        _ALIGN_HV = Qt.AlignHCenter | Qt.AlignVCenter
+
+
+def _tight(layout, margins: tuple = _ROW_MARGINS, spacing: int = 6) -> None:
+    """Apply contents margins and spacing to a box layout."""
+    layout.setContentsMargins(*margins)
+    layout.setSpacing(spacing)
+
+
+_BOLD_FONT = None
+
+
+def _bold_font():
+    """Bold QFont shared by the rig table headers, built on first use (needs a QApplication)."""
+    global _BOLD_FONT
+    if _BOLD_FONT is None:
+        from PyQt5.QtGui import QFont
+        f = QFont()
+        f.setBold(True)
+        _BOLD_FONT = f
+    return _BOLD_FONT
+
+
+# palettes and push button LED colors shared by every enable toggle, indexed by
+# enabled state (0 -> disabled, 1 -> enabled); built on first use like _BOLD_FONT
+_PALETTES = None
+_BTN_LED_COLORS = None
+
+
+def _palettes() -> tuple:
+    """(disabled, normal) palettes: the disabled one grays labels and button texts."""
+    global _PALETTES
+    if _PALETTES is None:
+        from PyQt5.QtGui import QColor, QPalette
+        from PyQt5.QtWidgets import QApplication
+        normal = QPalette(QApplication.palette())
+        disabled = QPalette(normal)
+        gray = QColor(136, 136, 136)
+        disabled.setColor(QPalette.WindowText, gray)
+        disabled.setColor(QPalette.ButtonText, gray)
+        _PALETTES = (disabled, normal)
+    return _PALETTES
+
+
+def _btn_led_colors() -> tuple:
+    """((on, off) gray, (on, off) green) QColors of the push button LEDs."""
+    global _BTN_LED_COLORS
+    if _BTN_LED_COLORS is None:
+        from PyQt5.QtGui import QColor
+        _BTN_LED_COLORS = ((QColor(120, 120, 120), QColor(80, 80, 80)),
+                           (QColor(0, 255, 0), QColor(0, 100, 0)))
+    return _BTN_LED_COLORS
+
+
+#*------------------------------------------------------------------------------------
+#* Rig table rows
+#*------------------------------------------------------------------------------------
+# neutral gray shown by an LED that is off
+LED_NEUTRAL = (120, 120, 120)
+
+# One entry per row of the rig table: label, default name, frequency (Hz) and mode
+RIG_CONFIGS = [
+    {'label': 'rig1', 'name': 'ICOM-706', 'freq': 14070000, 'mode': 'USB'},
+    {'label': 'rig2', 'name': 'FT-2000', 'freq': 7200000, 'mode': 'LSB'},
+]
+
+
+def _make_rig_row(win, row: int, cfg: dict, group, grid_spec: list) -> types.SimpleNamespace:
+    """Create the widgets of one rig table row.
+
+    The radio button joins group, the grid placements are appended to grid_spec
+    as (widget, row, column, alignment) and the widgets are returned as a namespace.
+    """
+    from PyQt5.QtWidgets import QCheckBox, QLabel, QRadioButton
+    from PyQt5.QtCore import Qt
+
+    radio = QRadioButton()
+    group.addButton(radio)
+    name = QLabel(cfg['name'])
+    name.setMinimumWidth(120)
+    # status LED, initial off (gray)
+    led = LedIndicator(diameter=10, color_on=(0, 255, 0), color_off=LED_NEUTRAL, on=False)
+    # frequency (Hz as integer) displayed as single centered label with one space before 'MHz'
+    freq = QLabel()
+    _set_freq(freq, cfg['freq'])
+    freq.setAlignment(_ALIGN_HV)
+    freq.setMinimumWidth(120)
+    mode = QLabel(cfg['mode'])
+    split_cb = QCheckBox('Split')
+    split_cb.setChecked(False)
+    split_cb.toggled.connect(functools.partial(_on_rig_split, win, f"RIG{row}_SPLIT", cfg['label'].capitalize()), Qt.DirectConnection)
+
+    grid_spec += [
+        (radio, row, 0, _ALIGN_C),
+        (QLabel(cfg['label']), row, 1, _ALIGN_LV),
+        (name, row, 2, _ALIGN_LV),
+        (led, row, 3, _ALIGN_C),
+        (freq, row, 4, _ALIGN_HV),
+        (mode, row, 5, _ALIGN_LV),
+        (split_cb, row, 6, _ALIGN_C),
+    ]
+    return types.SimpleNamespace(radio=radio, name=name, led=led, freq=freq, mode=mode, split_cb=split_cb)
+
+
+#*------------------------------------------------------------------------------------
+#* Slider rows (Power, Volume)
+#*------------------------------------------------------------------------------------
+def _make_slider_row(win, group: str, title: str, code: str, debug: bool) -> types.SimpleNamespace:
+    """Create one enable-checkbox / label / 0..255 slider / value / Set row.
+
+    group is the win._enabled key, title the label text (also the handler tag;
+    its upper case form is the config key) and code the setButton command.
+    """
+    from PyQt5.QtWidgets import QCheckBox, QHBoxLayout, QLabel, QPushButton, QSlider
+    from PyQt5.QtCore import Qt
+
+    row = QHBoxLayout()
+    _tight(row)
+
+    label = QLabel(title)
+    label.setMinimumWidth(50)
+    # checkbox to toggle enabled state for the control group
+    enable_cb = QCheckBox()
+    enable_cb.setChecked(True)
+    enable_cb.setVisible(debug)
+    slider = QSlider(Qt.Horizontal)
+    slider.setRange(0, 255)
+    slider.setValue(0)
+    slider.setFixedWidth(220)
+    value = QLabel('0')
+    value.setMinimumWidth(30)
+    set_btn = QPushButton('Set')
+
+    slider.valueChanged.connect(functools.partial(_on_slider_change, win, group, title, value), Qt.DirectConnection)
+    # connect Set button (exactly once: Qt connections are additive) to send and persist the value
+    set_btn.clicked.connect(functools.partial(_on_slider_set, win, group, slider, title.upper(), code), Qt.DirectConnection)
+
+    # enable/disable helper for the control group
+    set_enabled = functools.partial(_set_controls_enabled, win, group, enable_cb, (slider, set_btn), (label, value))
+    set_enabled(True)
+    # wire checkbox to enable/disable
+    enable_cb.stateChanged.connect(functools.partial(_on_enable_state, set_enabled), Qt.DirectConnection)
+
+    for w in (enable_cb, label, slider, value, set_btn):
+        row.addWidget(w)
+
+    return types.SimpleNamespace(group=group, row=row, enable_cb=enable_cb, slider=slider, value=value,
+                                 set_btn=set_btn, set_enabled=set_enabled)
 
 
 def build_window(debug: bool = False) -> QWidget:
@@ -645,12 +1120,32 @@ def build_window(debug: bool = False) -> QWidget:
     # Creates GUI Dialog object and place all controls and handlers on it
     # ----------------------------------------------------------------------
 
+    # All Qt names used by the GUI are imported once here.
+    from PyQt5.QtWidgets import (
+        QWidget,
+        QVBoxLayout,
+        QHBoxLayout,
+        QGridLayout,
+        QLabel,
+        QComboBox,
+        QRadioButton,
+        QButtonGroup,
+        QGroupBox,
+        QCheckBox,
+        QFrame,
+    )
+    from PyQt5.QtCore import QCoreApplication, Qt, QTimer
+    from PyQt5.QtGui import QColor
+
+    # PyMeter widget classes and the _ALIGN_* constants are looked up as globals below
+    _load_pymeter()
+    _init_align()
+
     win = QWidget()
     win.setWindowTitle('PyControl (c) LU7DZ 2025')
     layout = QVBoxLayout(win)
     # reduce vertical spacing so elements sit tightly
-    layout.setSpacing(2)
-    layout.setContentsMargins(8, 6, 8, 6)
+    _tight(layout, (8, 6, 8, 6), 2)
 
     # ----------------------------------------------------------------------
     # Creates COM object to handle interaction with OmniRig
@@ -660,55 +1155,86 @@ def build_window(debug: bool = False) -> QWidget:
        omni = win32com.client.DispatchWithEvents("OmniRig.OmniRigX", OmniRigEvents)
        rig1 = omni.Rig1
        rig2 = omni.Rig2
-       print(f"Initialized OmniRig rig1({omni.Rig1.RigType}) rig2({omni.Rig2.RigType})")
+       with _com_lock:
+          log.info("Initialized OmniRig rig1(%s) rig2(%s)", rig1.RigType, rig2.RigType)
     else:
-       print(f"Omnirig initialization skipped (non Windows environment)")
+       log.info("Omnirig initialization skipped (non Windows environment)")
 
 
 
     # configuration persistence helpers (PyControl.ini in this folder)
-    cfg_path = Path(__file__).resolve().parent / 'PyControl.ini'
+    cfg_path = _HERE.parent / 'PyControl.ini'
 
     def _read_cfg() -> dict:
-        cfg = {}
         try:
-            if cfg_path.exists():
-                for line in cfg_path.read_text().splitlines():
-                    line = line.strip()
-                    if not line or line.startswith('#'):
-                        continue
-                    if '=' in line:
-                        k, v = line.split('=', 1)
-                        cfg[k.strip()] = v.strip()
-            else:
-                # generate defaults
-                cfg = {
-                    'RIG': 'rig1',
-                    'LEFT': 'Signal',
-                    'ANT': 'ant 1',
-                    'VFO': 'VFO A',
-                    'MODE': 'CW',
-                    'POWER': '0',
-                    'VOLUME': '0'
-                }
-                _write_cfg(cfg)
+            return _load_cfg(cfg_path)
+        except FileNotFoundError:
+            # generate defaults
+            cfg = dict(CFG_DEFAULTS)
+            _write_cfg(cfg)
+            return cfg
         except Exception:
-            pass
-        return cfg
+            # unreadable file: run on the defaults and never write over it
+            log.warning("%s can not be read, using defaults", cfg_path, exc_info=True)
+            win._cfg_readonly = True
+            return dict(CFG_DEFAULTS)
 
     def _write_cfg(cfg: dict) -> None:
+        if win._cfg_readonly:
+            return
         try:
-            cfg_path.write_text('\n'.join(f"{k}={v}" for k, v in cfg.items()) + '\n')
+            _store_cfg(cfg_path, cfg)
         except Exception:
             pass
 
-    def _save_key(key: str, value: str) -> None:
-        try:
-            cfg = _read_cfg()
-            cfg[key] = str(value)
-            _write_cfg(cfg)
-        except Exception:
-            pass
+    # parsed configuration is kept in memory; the file is only read once
+    win._cfg_readonly = False
+    win._cfg_cache = _read_cfg()
+
+    win._cfg_dirty = False
+
+    def _flush_cfg() -> None:
+        """Write the cached configuration if anything changed since the last write."""
+        if win._cfg_dirty:
+            win._cfg_dirty = False
+            _write_cfg(win._cfg_cache)
+
+    # coalesce bursts of changes into a single write of the INI file
+    cfg_timer = QTimer(win)
+    cfg_timer.setSingleShot(True)
+    cfg_timer.setInterval(500)
+    cfg_timer.timeout.connect(_flush_cfg, Qt.DirectConnection)
+    win._cfg_timer = cfg_timer
+
+    # pending changes are written when the window is closed
+    def _close_event(event) -> None:
+        cfg_timer.stop()
+        _flush_cfg()
+        QWidget.closeEvent(win, event)
+
+    win.closeEvent = _close_event
+
+    # rig status changes received while hidden are applied once on show
+    def _show_event(event) -> None:
+        QWidget.showEvent(win, event)
+        if _status_dirty:
+            _request_status()
+
+    win.showEvent = _show_event
+    # ...and also when the application quits without closing it (e.g. Ctrl+C, quit()).
+    # The application outlives the window: it only gets a weak reference, so a
+    # discarded window (tests build several) can still be collected.
+    win._flush_cfg = _flush_cfg
+    win_ref = weakref.ref(win)
+
+    def _flush_on_quit() -> None:
+        w = win_ref()
+        if w is not None:
+            w._flush_cfg()
+
+    app = QCoreApplication.instance()
+    if app is not None:
+        app.aboutToQuit.connect(_flush_on_quit)
 
     # label + small LED above the meter (tighter margins)
     label_signal = QLabel("Signal")
@@ -720,32 +1246,23 @@ def build_window(debug: bool = False) -> QWidget:
     signal_led.set_on(True)
 
     signal_row = QHBoxLayout()
-    signal_row.setContentsMargins(0, 0, 0, 0)
-    signal_row.setSpacing(6)
+    _tight(signal_row, (0, 0, 0, 0))
     signal_row.addWidget(label_signal)
     signal_row.addWidget(signal_led)
     signal_row.addStretch()
     layout.addLayout(signal_row)
 
     # Mode selector placed on the same row as the meter (right-aligned)
-    from PyQt5.QtWidgets import QComboBox
-    from PyQt5.QtCore import Qt
-
     mode_selector = QComboBox()
     mode_selector.addItems(["CW", "USB", "LSB", "AM", "FM", "DIG-U", "DIG-L", "CW-R"])
     mode_selector.setFixedWidth(110)
     mode_selector.setCurrentIndex(0)
-    def _on_mode_changed(t: str) -> None:
-        try:
-            if rig1_radio.isChecked():
-               rig=omni.Rig1
-            else:
-               rig=omni.Rig2
-            print(f"Mode selector changed: {pushMode(rig,t)}")
-            _save_key('MODE', t)
-        except Exception:
-            pass
-    mode_selector.currentTextChanged.connect(_on_mode_changed)
+    win._mode_pending = mode_selector.currentText()
+    win._mode_timer = QTimer(win)
+    win._mode_timer.setSingleShot(True)
+    win._mode_timer.setInterval(MODE_DEBOUNCE_MS)
+    win._mode_timer.timeout.connect(functools.partial(_apply_mode, win), Qt.DirectConnection)
+    mode_selector.currentTextChanged.connect(functools.partial(_on_mode_changed, win), Qt.DirectConnection)
 
     # meter row: meter at left, mode selector at right
     meter_row = QHBoxLayout()
@@ -753,422 +1270,131 @@ def build_window(debug: bool = False) -> QWidget:
     meter.setContentsMargins(0, 0, 0, 2)
     meter_row.addWidget(meter)
     meter_row.addStretch()
-    meter_row.addWidget(mode_selector, alignment=Qt.AlignRight | Qt.AlignVCenter)
+    meter_row.addWidget(mode_selector, alignment=_ALIGN_RV)
     layout.addLayout(meter_row)
 
     # timer to toggle the small signal LED once per second, alternate colors
-    try:
-        from PyQt5.QtCore import QTimer
-        win._signal_led_state = False
-        def _toggle_signal_led() -> None:
-            try:
-                if getattr(win, '_signal_led_state', False):
-                    signal_led.set_color_on((0, 100, 0))
-                else:
-                    signal_led.set_color_on((0, 255, 0))
-                signal_led.set_on(True)
-                win._signal_led_state = not getattr(win, '_signal_led_state', False)
-                updateStatus()
-                updateSplit()
-                updateMeter()
-            except Exception:
-                pass
-        timer = QTimer()
-        timer.timeout.connect(_toggle_signal_led)
-        timer.start(1000)
-        win._signal_timer = timer
-    except Exception:
-        pass
+    # both colors are built once and alternated by index (0 -> lime, 1 -> dark green)
+    signal_colors = (QColor(0, 255, 0), QColor(0, 100, 0))
+    win._signal_led_state = 0
+    def _toggle_signal_led() -> None:
+        signal_led.set_color_on(signal_colors[win._signal_led_state])
+        signal_led.set_on(True)
+        win._signal_led_state ^= 1
+        # rig labels are refreshed on OmniRig events (see _request_status);
+        # the tick only catches a refresh still pending and polls the meter
+        _flush_status()
+        updateMeter()
+    timer = QTimer()
+    timer.timeout.connect(_toggle_signal_led, Qt.DirectConnection)
+    timer.start(1000)
+    win._signal_timer = timer
+    # single-shot timer behind _request_status()
+    status_timer = QTimer(win)
+    status_timer.setSingleShot(True)
+    status_timer.setInterval(50)
+    status_timer.timeout.connect(_flush_status, Qt.DirectConnection)
+    win._status_timer = status_timer
 
     # Two-row table with headers: '', rig, name, status, freq, mode
-    from PyQt5.QtWidgets import QGridLayout, QRadioButton, QButtonGroup, QCheckBox
-    from PyQt5.QtCore import Qt
-
     grid = QGridLayout()
     # tighten spacing so table is close to meter
     grid.setContentsMargins(0, 2, 0, 2)
     grid.setHorizontalSpacing(12)
     grid.setVerticalSpacing(4)
 
+    # (widget, row, column, alignment) entries, placed in a single loop once built
+    grid_spec = []
+
     headers = ['', 'rig', 'name', 'status', 'freq', 'mode', 'split']
     for c, h in enumerate(headers):
-        lbl = QLabel(f"<b>{h}</b>") if h else QLabel('')
+        # plain text with a shared bold font (no rich-text parsing per header)
+        lbl = QLabel(h)
+        if h:
+            lbl.setFont(_bold_font())
         # center the 'freq' header above its column, keep others left-aligned
         if h == 'freq':
-            lbl.setAlignment(Qt.AlignHCenter | Qt.AlignVCenter)
+            lbl.setAlignment(_ALIGN_HV)
         else:
-            lbl.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-        grid.addWidget(lbl, 0, c)
+            lbl.setAlignment(_ALIGN_LV)
+        grid_spec.append((lbl, 0, c, _ALIGN_NONE))
 
-    # Row 1: rig1
-    rig1_radio = QRadioButton()
-    rig2_radio = QRadioButton()
+    # Rig rows: one namespace per rig (see RIG_CONFIGS); the per-field lists
+    # below are indexed by row (0 -> rig1, 1 -> rig2)
     rig_group = QButtonGroup(win)
-    rig_group.addButton(rig1_radio)
-    rig_group.addButton(rig2_radio)
+    rigs = [_make_rig_row(win, row, cfg, rig_group, grid_spec) for row, cfg in enumerate(RIG_CONFIGS, start=1)]
+    rig_radios = [r.radio for r in rigs]
+    rig_names = [r.name for r in rigs]
+    rig_leds = [r.led for r in rigs]
+    rig_freqs = [r.freq for r in rigs]
+    rig_modes = [r.mode for r in rigs]
+    rig_split_cbs = [r.split_cb for r in rigs]
+    win._rigs = rigs
+
+    for w, r, c, a in grid_spec:
+        grid.addWidget(w, r, c, a)
+
+    rig1_radio, rig2_radio = rig_radios
+    rig1_split_cb, rig2_split_cb = rig_split_cbs
     rig1_radio.setChecked(True)
 
-    rig1_label = QLabel('rig1')
-    rig1_name = QLabel('ICOM-706')
-    rig1_name.setMinimumWidth(120)
-    rig1_led = LedIndicator(diameter=10)
-    # initial off (gray)
-    rig1_led.set_color_on((0, 255, 0))
-    rig1_led.set_color_off((120, 120, 120))
-    rig1_led.set_on(False)
-
-    # frequency label formatted as integer (Hz) with thousands sep, up to 435000000
-    rig1_freq_value = 14070000  # Hz as integer
-    rig1_freq = QLabel(f"{rig1_freq_value:,d}")
-    rig1_freq.setMinimumWidth(110)
-    rig1_mhz = QLabel('MHz')
-    rig1_mode = QLabel('USB')
-
-    # place rig1 widgets
-    grid.addWidget(rig1_radio, 1, 0, alignment=Qt.AlignCenter)
-    grid.addWidget(rig1_label, 1, 1, alignment=Qt.AlignLeft | Qt.AlignVCenter)
-    grid.addWidget(rig1_name, 1, 2, alignment=Qt.AlignLeft | Qt.AlignVCenter)
-    grid.addWidget(rig1_led, 1, 3, alignment=Qt.AlignCenter)
-
-    # frequency displayed as single right-aligned label with one space before 'MHz'
-    rig1_freq = QLabel(f"{rig1_freq_value:,d} MHz")
-    rig1_freq.setAlignment(Qt.AlignHCenter | Qt.AlignVCenter)
-    rig1_freq.setMinimumWidth(120)
-    grid.addWidget(rig1_freq, 1, 4, alignment=Qt.AlignHCenter | Qt.AlignVCenter)
-    grid.addWidget(rig1_mode, 1, 5, alignment=Qt.AlignLeft | Qt.AlignVCenter)
-    # Split checkbox for rig1
-    rig1_split_cb = QCheckBox('Split')
-    rig1_split_cb.setChecked(False)
-    def _on_rig1_split(checked: bool) -> None:
-        try:
-            print(f"Rig1 Split: {bool(checked)}")
-            _save_key('RIG1_SPLIT', '1' if checked else '0')
-        except Exception:
-            pass
-    rig1_split_cb.toggled.connect(_on_rig1_split)
-    grid.addWidget(rig1_split_cb, 1, 6, alignment=Qt.AlignCenter)
-
-    # Row 2: rig2
-    rig2_label = QLabel('rig2')
-    rig2_name = QLabel('FT-2000')
-    rig2_name.setMinimumWidth(120)
-    rig2_led = LedIndicator(diameter=10)
-    rig2_led.set_color_off((120, 120, 120))
-    rig2_led.set_color_on((0, 255, 0))
-    rig2_led.set_on(False)
-
-    rig2_freq_value = 7200000  # Hz as integer
-    rig2_freq = QLabel(f"{rig2_freq_value:,d} MHz")
-    rig2_freq.setAlignment(Qt.AlignHCenter | Qt.AlignVCenter)
-    rig2_freq.setMinimumWidth(120)
-    rig2_mode = QLabel('LSB')
-
-    grid.addWidget(rig2_radio, 2, 0, alignment=Qt.AlignCenter)
-    grid.addWidget(rig2_label, 2, 1, alignment=Qt.AlignLeft | Qt.AlignVCenter)
-    grid.addWidget(rig2_name, 2, 2, alignment=Qt.AlignLeft | Qt.AlignVCenter)
-    grid.addWidget(rig2_led, 2, 3, alignment=Qt.AlignCenter)
-    grid.addWidget(rig2_freq, 2, 4, alignment=Qt.AlignRight | Qt.AlignVCenter)
-    grid.addWidget(rig2_mode, 2, 5, alignment=Qt.AlignLeft | Qt.AlignVCenter)
-    # Split checkbox for rig2
-    rig2_split_cb = QCheckBox('Split')
-    rig2_split_cb.setChecked(False)
-    def _on_rig2_split(checked: bool) -> None:
-        try:
-            print(f"Rig2 Split: {bool(checked)}")
-            _save_key('RIG2_SPLIT', '1' if checked else '0')
-        except Exception:
-            pass
-    rig2_split_cb.toggled.connect(_on_rig2_split)
-    grid.addWidget(rig2_split_cb, 2, 6, alignment=Qt.AlignCenter)
-
     # connect rig selection event
-    def _on_rig_selected(button) -> None:
-        try:
-            if rig1_radio.isChecked():
-                sel = 'rig1'
-                if rig1_split_cb.isChecked():
-                   omni.Rig1.Split=PM_SPLITON
-                   print(f"Rig ({omni.Rig1.RigType}) Split(ON)")
-                else:
-                   omni.Rig1.Split=PM_SPLITOFF
-                   print(f"Rig ({omni.Rig1.RigType}) Split(OFF)")
-            elif rig2_radio.isChecked():
-                sel = 'rig2'
-                if rig2_split_cb.isChecked():
-                   omni.Rig2.Split=PM_SPLITON
-                   print(f"Rig ({omni.Rig1.RigType}) Split(ON)")
-                else:
-                   omni.Rig2.Split=PM_SPLITOFF
-                   print(f"Rig ({omni.Rig1.RigType}) Split(ON)")
-            else:
-                sel = 'unknown'
-            print(f"Rig selected: {sel}")
-            
-            _save_key('RIG', sel)
-        except Exception:
-            pass
-
-    rig_group.buttonClicked.connect(_on_rig_selected)
+    rig_group.buttonClicked.connect(functools.partial(_on_rig_selected, win), Qt.DirectConnection)
 
     # ensure columns align by setting minimum widths for key columns
     # name column (2) and freq column (4)
     # Add grid to main layout
     layout.addLayout(grid)
 
-    # Power control row immediately below the rig table
-    from PyQt5.QtWidgets import QSlider, QPushButton
-    from PyQt5.QtCore import Qt
-
-    power_row = QHBoxLayout()
-    power_row.setContentsMargins(0, 4, 0, 4)
-    power_row.setSpacing(6)
-
-    power_label = QLabel('Power')
-    power_label.setMinimumWidth(50)
-    # checkbox to toggle enabled state for the power control group
-    from PyQt5.QtWidgets import QCheckBox
-    power_enable_cb = QCheckBox()
-    power_enable_cb.setChecked(True)
-    power_enable_cb.setVisible(debug)
-    power_slider = QSlider(Qt.Horizontal)
-    power_slider.setRange(0, 255)
-    power_slider.setValue(0)
-    power_slider.setFixedWidth(220)
-    power_value = QLabel('0')
-    power_value.setMinimumWidth(30)
-    set_btn = QPushButton('Set')
-
-    def _on_power_change(v: int) -> None:
-        try:
-            # do nothing if controls are disabled
-            if not getattr(win, '_power_enabled', True):
-                return
-            power_value.setText(str(int(v)))
-            print(f"Power slider changed: {int(v)}")
-        except Exception:
-            pass
-
-    power_slider.valueChanged.connect(_on_power_change)
-    # connect Set button to emit a simple console event with current slider value and persist
-    def _on_power_set(_=False):
-        try:
-            if not getattr(win, '_power_enabled', True):
-                return
-            val = int(power_slider.value())
-            print(f"Set button pressed: power={setButton('PWR',val)}")
-            _save_key('POWER', str(val))
-        except Exception:
-            pass
-    set_btn.clicked.connect(_on_power_set)
-
-    # enable/disable helper for the power control group
-    win._power_enabled = True
-    def set_power_enabled(enabled: bool) -> None:
-        try:
-            en = bool(enabled)
-            win._power_enabled = en
-            power_slider.setEnabled(en)
-            set_btn.setEnabled(en)
-            power_enable_cb.setChecked(en)
-            # gray out text when disabled
-            if en:
-                power_label.setStyleSheet("")
-                power_value.setStyleSheet("")
-            else:
-                power_label.setStyleSheet("color: #888888;")
-                power_value.setStyleSheet("color: #888888;")
-        except Exception:
-            pass
-
-    set_power_enabled(True)
-    set_btn.clicked.connect(_on_power_set)
-
-    # wire checkbox to enable/disable
-    try:
-        power_enable_cb.stateChanged.connect(lambda s: set_power_enabled(s == 2))
-    except Exception:
-        pass
-
-    power_row.addWidget(power_enable_cb)
-    power_row.addWidget(power_label)
-    power_row.addWidget(power_slider)
-    power_row.addWidget(power_value)
-    power_row.addWidget(set_btn)
-
-    layout.addLayout(power_row)
-
-    # expose power control enable API
-    setattr(win, 'set_power_enabled', set_power_enabled)
-    setattr(win, 'power_enabled', lambda: getattr(win, '_power_enabled', True))
-
-    # Volume control row directly below Power
-    volume_row = QHBoxLayout()
-    volume_row.setContentsMargins(0, 4, 0, 4)
-    volume_row.setSpacing(6)
-
-    volume_label = QLabel('Volume')
-    volume_label.setMinimumWidth(50)
-    # checkbox controlling the Volume group enabled state
-    volume_enable_cb = QCheckBox()
-    volume_enable_cb.setChecked(True)
-    volume_enable_cb.setVisible(debug)
-    volume_slider = QSlider(Qt.Horizontal)
-    volume_slider.setRange(0, 255)
-    volume_slider.setValue(0)
-    volume_slider.setFixedWidth(220)
-    volume_value = QLabel('0')
-    volume_value.setMinimumWidth(30)
-    volume_set_btn = QPushButton('Set')
-
-    def _on_volume_change(v: int) -> None:
-        try:
-            if not getattr(win, '_volume_enabled', True):
-                return
-            volume_value.setText(str(int(v)))
-            print(f"Volume slider changed: {int(v)}")
-        except Exception:
-            pass
-
-    volume_slider.valueChanged.connect(_on_volume_change)
-    def _on_volume_set(_=False):
-        try:
-            if not getattr(win, '_volume_enabled', True):
-                return
-            val = int(volume_slider.value())
-            print(f"Set button pressed: volume={setButton('VOL',val)}")
-            _save_key('VOLUME', str(val))
-        except Exception:
-            pass
-    volume_set_btn.clicked.connect(_on_volume_set)
+    # last value shown by each slider label, keyed by slider name
+    win._slider_last = {}
+    # enabled state of each control group, the single source for handlers and *_enabled()
+    win._enabled = dict(power=True, volume=True, left=True, mid=True, right=True,
+                        tr=True, mute=True, tune=True)
 
-    # enable/disable helper for the volume control group
-    win._volume_enabled = True
-    def set_volume_enabled(enabled: bool) -> None:
-        try:
-            en = bool(enabled)
-            win._volume_enabled = en
-            volume_slider.setEnabled(en)
-            volume_set_btn.setEnabled(en)
-            volume_enable_cb.setChecked(en)
-            if en:
-                volume_label.setStyleSheet("")
-                volume_value.setStyleSheet("")
-            else:
-                volume_label.setStyleSheet("color: #888888;")
-                volume_value.setStyleSheet("color: #888888;")
-        except Exception:
-            pass
+    # Power control row immediately below the rig table, Volume directly below Power
+    power = _make_slider_row(win, 'power', 'Power', 'PWR', debug)
+    volume = _make_slider_row(win, 'volume', 'Volume', 'VOL', debug)
+    for s in (power, volume):
+        layout.addLayout(s.row)
+        # expose the enable API of each slider group
+        setattr(win, f'set_{s.group}_enabled', s.set_enabled)
+        setattr(win, f'{s.group}_enabled', functools.partial(win._enabled.__getitem__, s.group))
 
-    set_volume_enabled(True)
-    # wire checkbox to enable/disable
-    try:
-        volume_enable_cb.stateChanged.connect(lambda s: set_volume_enabled(s == 2))
-    except Exception:
-        pass
-
-    volume_row.addWidget(volume_enable_cb)
-    volume_row.addWidget(volume_label)
-    volume_row.addWidget(volume_slider)
-    volume_row.addWidget(volume_value)
-    volume_row.addWidget(volume_set_btn)
-
-    layout.addLayout(volume_row)
-
-    # expose volume control enable API
-    setattr(win, 'set_volume_enabled', set_volume_enabled)
-    setattr(win, 'volume_enabled', lambda: getattr(win, '_volume_enabled', True))
+    power_enable_cb, power_slider, power_value = power.enable_cb, power.slider, power.value
+    volume_enable_cb, volume_slider, volume_value = volume.enable_cb, volume.slider, volume.value
 
     # Three radio groups row (between sliders and buttons)
-    from PyQt5.QtWidgets import QRadioButton, QButtonGroup, QGroupBox, QComboBox
-    from PyQt5.QtCore import Qt
-
     groups_row = QHBoxLayout()
-    groups_row.setContentsMargins(0, 4, 0, 4)
-    groups_row.setSpacing(6)
-
-    # Left group: vertical SWR / Power / Signal
-    left_box = QGroupBox()
-    left_layout = QVBoxLayout()
-    rb_swr = QRadioButton('SWR')
-    rb_power = QRadioButton('Power')
-    rb_signal = QRadioButton('Signal')
-    rb_none = QRadioButton('None')
-    left_group = QButtonGroup(left_box)
-    left_group.addButton(rb_swr)
-    left_group.addButton(rb_power)
-    left_group.addButton(rb_signal)
-    left_group.addButton(rb_none)
-    rb_signal.setChecked(True)
-    left_layout.addWidget(rb_swr)
-    left_layout.addWidget(rb_power)
-    left_layout.addWidget(rb_signal)
-    left_layout.addWidget(rb_none)
-    left_box.setLayout(left_layout)
-
-    def _on_left_changed(button) -> None:
-        try:
-            txt = button.text()
-            print(f"Left group selected: {setVUMeter(txt)}")
-            _save_key('LEFT', txt)
-        except Exception:
-            pass
-
-    left_group.buttonClicked.connect(_on_left_changed)
-
+    _tight(groups_row)
+
+    # Three radio groups; each radio gets its index in the names tuple as its
+    # QButtonGroup id, so the slots dispatch on idClicked without reading texts
+    def _radio_group(names, checked: int, tag: str, key: str, action):
+        box = QGroupBox()
+        box_layout = QVBoxLayout()
+        group = QButtonGroup(box)
+        buttons = tuple(QRadioButton(n) for n in names)
+        for i, rb in enumerate(buttons):
+            group.addButton(rb, i)
+            box_layout.addWidget(rb)
+        buttons[checked].setChecked(True)
+        box.setLayout(box_layout)
+        group.idClicked.connect(functools.partial(_group_click, win, tag, key, action, names), Qt.DirectConnection)
+        return box, group, buttons
+
+    # Left group: vertical SWR / Power / Signal / None
+    left_box, left_group, left_buttons = _radio_group(_LEFT_NAMES, 2, 'Left group', 'LEFT', setVUMeter)
+    rb_swr, rb_power, rb_signal, rb_none = left_buttons
     # Middle group: Antenna 1 / 2
-    mid_box = QGroupBox()
-    mid_layout = QVBoxLayout()
-    rb_ant1 = QRadioButton('ant 1')
-    rb_ant2 = QRadioButton('ant 2')
-    mid_group = QButtonGroup(mid_box)
-    mid_group.addButton(rb_ant1)
-    mid_group.addButton(rb_ant2)
-    rb_ant1.setChecked(True)
-    mid_layout.addWidget(rb_ant1)
-    mid_layout.addWidget(rb_ant2)
-    mid_box.setLayout(mid_layout)
-
-    def _on_mid_changed(button) -> None:
-        try:
-            txt = button.text()
-            print(f"Antenna selected: {setAntenna(txt)}")
-            _save_key('ANT', txt)
-        except Exception:
-            pass
-
-    mid_group.buttonClicked.connect(_on_mid_changed)
-
+    mid_box, mid_group, mid_buttons = _radio_group(_ANT_NAMES, 0, 'Antenna', 'ANT', setAntenna)
+    rb_ant1, rb_ant2 = mid_buttons
     # Right group: VFO A / VFO B
-    right_box = QGroupBox()
-    right_layout = QVBoxLayout()
-    rb_vfoa = QRadioButton('VFO A')
-    rb_vfob = QRadioButton('VFO B')
-    right_group = QButtonGroup(right_box)
-    right_group.addButton(rb_vfoa)
-    right_group.addButton(rb_vfob)
-    rb_vfoa.setChecked(True)
-    right_layout.addWidget(rb_vfoa)
-    right_layout.addWidget(rb_vfob)
-    right_box.setLayout(right_layout)
-
-    def _on_right_changed(button) -> None:
-        try:
-            txt = button.text()
-            if rig1_radio.isChecked():
-               print(f"Rig({omni.Rig1.RigType}) VFO selected: {txt}")
-               setVfo(omni.Rig1,txt)
-            else:
-               print(f"Rig({omni.Rig2.RigType}) VFO selected: {txt}")
-               setVfo(omni.Rig2,txt)
-            _save_key('VFO', txt)
-        except Exception:
-            pass
-
-    right_group.buttonClicked.connect(_on_right_changed)
+    right_box, right_group, right_buttons = _radio_group(_VFO_NAMES, 0, 'VFO', 'VFO', _select_vfo)
+    rb_vfoa, rb_vfob = right_buttons
 
     # assemble groups row compactly so dialog width doesn't increase
     # add small checkboxes (no labels) to control Enabled state per group
-    from PyQt5.QtWidgets import QCheckBox
     left_enable_cb = QCheckBox()
     left_enable_cb.setChecked(True)
     left_enable_cb.setVisible(debug)
@@ -1179,186 +1405,89 @@ def build_window(debug: bool = False) -> QWidget:
     right_enable_cb.setChecked(True)
     right_enable_cb.setVisible(debug)
 
-    groups_row.addWidget(left_enable_cb)
-    groups_row.addWidget(left_box)
-    groups_row.addStretch()
-    groups_row.addWidget(mid_enable_cb)
-    groups_row.addWidget(mid_box)
-    groups_row.addStretch()
-    groups_row.addWidget(right_enable_cb)
-    groups_row.addWidget(right_box)
+    for i, (cb, box) in enumerate(((left_enable_cb, left_box), (mid_enable_cb, mid_box), (right_enable_cb, right_box))):
+        if i:
+            groups_row.addStretch()
+        groups_row.addWidget(cb)
+        groups_row.addWidget(box)
 
     layout.addLayout(groups_row)
 
     # helpers to enable/disable each radio group and gray out labels when disabled
-    def set_left_enabled(enabled: bool) -> None:
-        try:
-            en = bool(enabled)
-            for b in (rb_swr, rb_power, rb_signal, rb_none):
-                b.setEnabled(en)
-                b.setStyleSheet("" if en else "color: #888888;")
-            left_enable_cb.setChecked(en)
-            # persist left enabled? not required
-            setattr(win, '_left_enabled', en)
-        except Exception:
-            pass
-
-    def set_mid_enabled(enabled: bool) -> None:
-        try:
-            en = bool(enabled)
-            for b in (rb_ant1, rb_ant2):
-                b.setEnabled(en)
-                b.setStyleSheet("" if en else "color: #888888;")
-            mid_enable_cb.setChecked(en)
-            setattr(win, '_mid_enabled', en)
-        except Exception:
-            pass
-
-    def set_right_enabled(enabled: bool) -> None:
-        try:
-            en = bool(enabled)
-            for b in (rb_vfoa, rb_vfob):
-                b.setEnabled(en)
-                b.setStyleSheet("" if en else "color: #888888;")
-            right_enable_cb.setChecked(en)
-            setattr(win, '_right_enabled', en)
-        except Exception:
-            pass
+    set_left_enabled = functools.partial(_set_controls_enabled, win, 'left', left_enable_cb, left_buttons, left_buttons)
+    set_mid_enabled = functools.partial(_set_controls_enabled, win, 'mid', mid_enable_cb, mid_buttons, mid_buttons)
+    set_right_enabled = functools.partial(_set_controls_enabled, win, 'right', right_enable_cb, right_buttons, right_buttons)
 
     # wire checkboxes to helpers
-    try:
-        left_enable_cb.stateChanged.connect(lambda s: set_left_enabled(s == 2))
-        mid_enable_cb.stateChanged.connect(lambda s: set_mid_enabled(s == 2))
-        right_enable_cb.stateChanged.connect(lambda s: set_right_enabled(s == 2))
-    except Exception:
-        pass
+    left_enable_cb.stateChanged.connect(functools.partial(_on_enable_state, set_left_enabled), Qt.DirectConnection)
+    mid_enable_cb.stateChanged.connect(functools.partial(_on_enable_state, set_mid_enabled), Qt.DirectConnection)
+    right_enable_cb.stateChanged.connect(functools.partial(_on_enable_state, set_right_enabled), Qt.DirectConnection)
 
     # expose APIs on window
     setattr(win, 'set_left_enabled', set_left_enabled)
-    setattr(win, 'left_enabled', lambda: getattr(win, '_left_enabled', True))
+    setattr(win, 'left_enabled', functools.partial(win._enabled.__getitem__, 'left'))
     setattr(win, 'set_mid_enabled', set_mid_enabled)
-    setattr(win, 'mid_enabled', lambda: getattr(win, '_mid_enabled', True))
+    setattr(win, 'mid_enabled', functools.partial(win._enabled.__getitem__, 'mid'))
     setattr(win, 'set_right_enabled', set_right_enabled)
-    setattr(win, 'right_enabled', lambda: getattr(win, '_right_enabled', True))
+    setattr(win, 'right_enabled', functools.partial(win._enabled.__getitem__, 'right'))
 
     # Apply persisted configuration (if any) to initialize control states
     try:
-        cfg = _read_cfg()
+        cfg = win._cfg_cache
         # rig
-        r = cfg.get('RIG', 'rig1')
-        rig1_radio.blockSignals(True)
-        rig2_radio.blockSignals(True)
-        if r == 'rig2':
-            rig2_radio.setChecked(True)
-        else:
-            rig1_radio.setChecked(True)
-        rig1_radio.blockSignals(False)
-        rig2_radio.blockSignals(False)
-        # left group
-        left_val = cfg.get('LEFT', 'Signal')
-        for b in (rb_swr, rb_power, rb_signal, rb_none):
-            b.blockSignals(True)
-            if b.text() == left_val:
-                b.setChecked(True)
-            b.blockSignals(False)
-        # mid group (antenna)
-        ant_val = cfg.get('ANT', 'ant 1')
-        for b in (rb_ant1, rb_ant2):
-            b.blockSignals(True)
-            if b.text() == ant_val:
-                b.setChecked(True)
-            b.blockSignals(False)
-        # right group (VFO)
-        vfo_val = cfg.get('VFO', 'VFO A')
-        for b in (rb_vfoa, rb_vfob):
-            b.blockSignals(True)
-            if b.text() == vfo_val:
-                b.setChecked(True)
-            b.blockSignals(False)
+        rig_group.blockSignals(True)
+        rig_radios[1 if cfg.get('RIG', 'rig1') == 'rig2' else 0].setChecked(True)
+        rig_group.blockSignals(False)
+        # left group, mid group (antenna) and right group (VFO)
+        for group, names, key in ((left_group, _LEFT_NAMES, 'LEFT'),
+                                  (mid_group, _ANT_NAMES, 'ANT'),
+                                  (right_group, _VFO_NAMES, 'VFO')):
+            _restore_group(group, names, cfg.get(key, CFG_DEFAULTS[key]))
         # mode selector
-        mode_val = cfg.get('MODE', 'CW')
-        idx = mode_selector.findText(mode_val)
+        idx = mode_selector.findText(cfg.get('MODE', 'CW'))
         if idx >= 0:
             mode_selector.blockSignals(True)
             mode_selector.setCurrentIndex(idx)
             mode_selector.blockSignals(False)
-        # sliders initial values from cfg (do not persist on change)
-        try:
-            p = int(cfg.get('POWER', '0'))
-            power_slider.blockSignals(True)
-            power_slider.setValue(p)
-            power_value.setText(str(p))
-            power_slider.blockSignals(False)
-        except Exception:
-            pass
-        try:
-            v = int(cfg.get('VOLUME', '0'))
-            volume_slider.blockSignals(True)
-            volume_slider.setValue(v)
-            volume_value.setText(str(v))
-            volume_slider.blockSignals(False)
-        except Exception:
-            pass
+        # sliders initial values from cfg (do not persist on change); a malformed
+        # value falls back to 0 so it cannot skip the remaining rows
+        for row, title in ((power, 'Power'), (volume, 'Volume')):
+            raw = cfg.get(title.upper(), '0').strip()
+            val = min(int(raw), 255) if raw.isdigit() else 0
+            row.slider.blockSignals(True)
+            row.slider.setValue(val)
+            row.value.setText(_SLIDER_STRS[val])
+            win._slider_last[title] = val
+            row.slider.blockSignals(False)
     except Exception:
         pass
 
     # small row of buttons (keep previous functionality)
-    from PyQt5.QtWidgets import QFrame
-
     btn_row = QHBoxLayout()
     tr = LedButton('RX')
     mute = LedButton('Mute')
     tune = TuneButton('Tune')
     # provide TuneButton with a reference to the main window so its _on_clicked can use self.win
-    try:
-        getattr(tune, '_setMainWindow', lambda w: None)(win)
-    except Exception:
-        pass
+    tune._setMainWindow(win)
+    # ensure Tune label uses requested capitalization
+    tune._button.setText('Tune')
 
-    # Set logical state to RX (0) for buttons if supported
-    try:
-        tr.set_state(0)
-        omni.Rig1.Tx=PM_RX
-        omni.Rig2.Tx=PM_RX
-    except Exception:
-        pass
-    try:
-        mute.set_state(0)
-    except Exception:
-        pass
-    try:
-        tune.set_state(0)
-    except Exception:
-        pass
-
-    # Ensure default LED visuals are dark/off initially
+    # logical state RX (0) and dark/off LEDs for the three buttons
+    led_on, led_off = _btn_led_colors()[1]
     for b in (tr, mute, tune):
-        try:
-            led = getattr(b, '_led', None)
-            if led is not None:
-                try:
-                    led.set_color_on((0, 255, 0))
-                except Exception:
-                    pass
-                try:
-                    led.set_color_off((0, 100, 0))
-                except Exception:
-                    pass
-                try:
-                    led.set_on(False)
-                except Exception:
-                    pass
-        except Exception:
-            pass
-
+        b.set_state(0)
+        b._led.set_color_on(led_on)
+        b._led.set_color_off(led_off)
+        b._led.set_on(False)
+    # both rigs start in RX; OmniRig may be absent (GUI evaluation mode)
     try:
-        # ensure Tune label uses requested capitalization
-        tune._button.setText('Tune')
+        with _com_lock:
+            omni.Rig1.Tx=PM_RX
+            omni.Rig2.Tx=PM_RX
     except Exception:
         pass
 
     # per-button enable checkboxes (no labels) to the left of each button
-    from PyQt5.QtWidgets import QCheckBox
     tr_cb = QCheckBox()
     tr_cb.setChecked(True)
     tr_cb.setVisible(debug)
@@ -1369,63 +1498,15 @@ def build_window(debug: bool = False) -> QWidget:
     tune_cb.setChecked(True)
     tune_cb.setVisible(debug)
 
-    def _set_button_enabled(btn_obj, checkbox, enabled: bool) -> None:
-        try:
-            en = bool(enabled)
-            # update checkbox state
-            try:
-                checkbox.setChecked(en)
-            except Exception:
-                pass
-            # underlying QPushButton
-            qbtn = getattr(btn_obj, '_button', None) or btn_obj
-            try:
-                qbtn.setEnabled(en)
-            except Exception:
-                pass
-            # label style
-            try:
-                qbtn.setStyleSheet('' if en else 'color: #888888;')
-            except Exception:
-                pass
-            # led visuals
-            try:
-                led = getattr(btn_obj, '_led', None)
-                if led is not None:
-                    if en:
-                        # restore normal colors (green on, dim off)
-                        led.set_color_on((0, 255, 0))
-                        led.set_color_off((0, 100, 0))
-                    else:
-                        # gray dark
-                        led.set_color_on((120, 120, 120))
-                        led.set_color_off((80, 80, 80))
-                    led.set_on(False)
-            except Exception:
-                pass
-            # store state on window
-            try:
-                name = getattr(btn_obj, '_button', None).text() if getattr(btn_obj, '_button', None) else str(btn_obj)
-                setattr(win, f"_btn_{name}_enabled", en)
-            except Exception:
-                pass
-        except Exception:
-            pass
-
-    def set_tr_enabled(enabled: bool) -> None:
-        _set_button_enabled(tr, tr_cb, enabled)
-    def set_mute_enabled(enabled: bool) -> None:
-        _set_button_enabled(mute, mute_cb, enabled)
-    def set_tune_enabled(enabled: bool) -> None:
-        _set_button_enabled(tune, tune_cb, enabled)
+    # enable helpers for the TX/RX, Mute and Tune buttons (see _set_button_enabled)
+    set_tr_enabled = functools.partial(_set_button_enabled, win, 'tr', tr, tr_cb)
+    set_mute_enabled = functools.partial(_set_button_enabled, win, 'mute', mute, mute_cb)
+    set_tune_enabled = functools.partial(_set_button_enabled, win, 'tune', tune, tune_cb)
 
     # wire checkboxes to helpers
-    try:
-        tr_cb.stateChanged.connect(lambda s: set_tr_enabled(s == 2))
-        mute_cb.stateChanged.connect(lambda s: set_mute_enabled(s == 2))
-        tune_cb.stateChanged.connect(lambda s: set_tune_enabled(s == 2))
-    except Exception:
-        pass
+    tr_cb.stateChanged.connect(functools.partial(_on_enable_state, set_tr_enabled), Qt.DirectConnection)
+    mute_cb.stateChanged.connect(functools.partial(_on_enable_state, set_mute_enabled), Qt.DirectConnection)
+    tune_cb.stateChanged.connect(functools.partial(_on_enable_state, set_tune_enabled), Qt.DirectConnection)
 
     # add to layout (checkbox then button for each)
     btn_row.addWidget(tr_cb)
@@ -1442,26 +1523,13 @@ def build_window(debug: bool = False) -> QWidget:
 
     # Override button actions: disconnect any existing handlers and replace with simple console log
     def _bind_simple(btn_obj, name: str):
-        try:
-            # attempt to access underlying QPushButton
-            qbtn = getattr(btn_obj, '_button', None) or getattr(btn_obj, 'button', None) or btn_obj
-            try:
-                qbtn.clicked.disconnect()
-            except Exception:
-                pass
-            #qbtn.clicked.connect(lambda checked=False, n=name: print(f"Button event: {n}"))
-            if rig1_radio.isChecked():
-               r=omni.Rig1
-            else:
-               r=omni.Rig2
-            qbtn.clicked.connect(lambda checked=False, n=name: print(f"Button event: {setPush(r,n)}"))
-        except Exception:
-            # fallback: print on exception
-            try:
-                btn_obj.clicked.disconnect()
-                btn_obj.clicked.connect(lambda checked=False, n=name: print(f"Button event: {n}"))
-            except Exception:
-                pass
+        # attempt to access underlying QPushButton
+        qbtn = getattr(btn_obj, '_button', None) or getattr(btn_obj, 'button', None) or btn_obj
+        # drop the widget's own handlers; disconnect() raises when there are none
+        if qbtn.receivers(qbtn.clicked) > 0:
+            qbtn.clicked.disconnect()
+        qbtn.setProperty('action_name', name)
+        qbtn.clicked.connect(functools.partial(_on_button_event, name), Qt.DirectConnection)
 
     _bind_simple(tr, 'RX')
     _bind_simple(mute, 'Mute')
@@ -1474,100 +1542,90 @@ def build_window(debug: bool = False) -> QWidget:
 
     # attach small helper methods for programmatic control
     def set_meter(val: int) -> None:
-        try:
-            meter.set_value(int(val))
-        except Exception:
-            pass
+        meter.set_value(int(val))
 
     def set_tr_state(v: int) -> None:
-        try:
-            tr.set_state(int(v))
-        except Exception:
-            pass
-
-    # expose onto widget for external use
-    setattr(win, 'set_meter', set_meter)
-    setattr(win, 'set_tr', set_tr_state)
-    setattr(win, 'meter', meter)
-    setattr(win, 'tr', tr)
-    setattr(win, 'tune', tune)
-    setattr(win, 'mute', mute)
+        tr.set_state(int(v))
 
     # helper methods to update rig row fields programmatically
+    # rig setters take the 1-based row number; out-of-range rows are ignored
+    n_rigs = len(rigs)
+
     def set_rig_name(index: int, name: str) -> None:
         """Set the display name for rig row 1 or 2."""
-        try:
-            if int(index) == 1:
-                rig1_name.setText(str(name))
-            else:
-                rig2_name.setText(str(name))
-        except Exception:
-            pass
+        i = int(index) - 1
+        if 0 <= i < n_rigs: _set_text(rig_names[i], str(name))
 
     def set_rig_led_color(index: int, color_on: tuple[int, int, int] | list[int], on: bool = True) -> None:
         """Set the LED on-color for the rig status LED and optionally its on/off state."""
-        try:
-            if int(index) == 1:
-                led = rig1_led
-            else:
-                led = rig2_led
-            if color_on is not None:
-                led.set_color_on(tuple(color_on))
-            led.set_on(bool(on))
-        except Exception:
-            pass
+        i = int(index) - 1
+        if not 0 <= i < n_rigs:
+            return
+        led = rig_leds[i]
+        if color_on is not None:
+            led.set_color_on(tuple(color_on))
+        led.set_on(bool(on))
 
     def set_rig_freq(index: int, hz: int) -> None:
         """Set the frequency label for the rig row. hz is an integer number of Hz.
         Display is formatted with thousands separators followed by a space and 'MHz'."""
-        try:
-            txt = f"{int(hz):,d} MHz"
-            if int(index) == 1:
-                rig1_freq.setText(txt)
-            else:
-                rig2_freq.setText(txt)
-        except Exception:
-            pass
+        i = int(index) - 1
+        if 0 <= i < n_rigs: _set_freq(rig_freqs[i], int(hz))
 
     def set_rig_mode(index: int, mode: str) -> None:
         """Set the mode label for the rig row (e.g., USB, LSB)."""
-        try:
-            if int(index) == 1:
-                rig1_mode.setText(str(mode))
-            else:
-                rig2_mode.setText(str(mode))
-        except Exception:
-            pass
-
-    setattr(win, 'set_rig_name', set_rig_name)
-    setattr(win, 'set_rig_led_color', set_rig_led_color)
-    setattr(win, 'set_rig_freq', set_rig_freq)
-    setattr(win, 'set_rig_mode', set_rig_mode)
-
-    # expose the rig table widgets for external manipulation
-    setattr(win, 'rig_group', rig_group)
-    setattr(win, 'rig1_radio', rig1_radio)
-    setattr(win, 'rig2_radio', rig2_radio)
-    setattr(win, 'rig1_name', rig1_name)
-    setattr(win, 'rig2_name', rig2_name)
-    setattr(win, 'rig1_led', rig1_led)
-    setattr(win, 'rig2_led', rig2_led)
-    setattr(win, 'rig1_freq_label', rig1_freq)
-    setattr(win, 'rig2_freq_label', rig2_freq)
-    setattr(win, 'rig1_mode', rig1_mode)
-    setattr(win, 'rig2_mode', rig2_mode)
+        i = int(index) - 1
+        if 0 <= i < n_rigs: _set_text(rig_modes[i], str(mode))
+
+    # expose helpers and widgets onto the window for external use, in one update
+    # (QWidget does not override __setattr__, so this is equivalent to setattr)
+    exports = {
+        'set_meter': set_meter,
+        'set_tr': set_tr_state,
+        'meter': meter,
+        'tr': tr,
+        'tune': tune,
+        'mute': mute,
+        'set_rig_name': set_rig_name,
+        'set_rig_led_color': set_rig_led_color,
+        'set_rig_freq': set_rig_freq,
+        'set_rig_mode': set_rig_mode,
+        'rig_group': rig_group,
+    }
+    # rig table widgets, rig1_* / rig2_*
+    for n, r in enumerate(rigs, start=1):
+        exports.update({
+            f'rig{n}_radio': r.radio,
+            f'rig{n}_name': r.name,
+            f'rig{n}_led': r.led,
+            f'rig{n}_freq_label': r.freq,
+            f'rig{n}_mode': r.mode,
+        })
+    win.__dict__.update(exports)
+
+    # rig selection restored above with signals blocked: seed the active rig cache
+    _refresh_active_rig()
 
     return win
 
 
 def main(argv: list[str] | None = None) -> int:
-    parser = argparse.ArgumentParser(description='PyControl GUI (reusing PyMeter widgets)')
-    parser.add_argument('--test', action='store_true', help='Animate meter for testing')
-    parser.add_argument('--debug', action='store_true', help='Show debug controls (checkboxes for Enabled)')
-    args = parser.parse_args(argv)
+    # Only a few boolean flags are supported, a plain argv scan is enough (argparse
+    # pulls in gettext, textwrap, re, ... on every start).
+    args = sys.argv[1:] if argv is None else argv
+    if '-h' in args or '--help' in args:
+        print('usage: PyControl.py [--linux] [--test] [--debug] [--verbose]')
+        return 0
+    test_mode = '--test' in args
+    debug_mode = '--debug' in args
+    logging.basicConfig(level=logging.DEBUG if '--verbose' in args else logging.INFO,
+                        format='%(message)s')
+
+    from PyQt5.QtCore import QTimer
+    from PyQt5.QtWidgets import QApplication, QWidget
 
     app = QApplication(sys.argv if argv is None else argv)
-    win = build_window(debug=bool(args.debug))
+    win = build_window(debug=debug_mode)
     win.show()
 
     # initial state
@@ -1577,41 +1635,39 @@ def main(argv: list[str] | None = None) -> int:
         win.set_tr(0)
 
     # optional test animation
-    if args.test:
-        from PyQt5.QtCore import QTimer
-
+    if test_mode:
         # animate lit segments from 0..meter._segments each second (ascending then descending)
-        seg = 0
-        direction = 1
+        max_seg = getattr(win.meter, '_segments', 15)
+        # map segment count to value 0..255 so meter lighting follows mapping
+        seg_values = tuple(int(round(s * 255.0 / max_seg)) for s in range(max_seg + 1))
+        # one full period, 1..max_seg then max_seg-1..0, replayed forever
+        test_seq = itertools.cycle(seg_values[1:] + seg_values[-2::-1])
 
         def tick() -> None:
-            nonlocal seg, direction
-            try:
-                max_seg = getattr(win, 'meter')._segments
-            except Exception:
-                max_seg = 15
-            seg += 1 * direction
-            if seg >= max_seg:
-                seg = max_seg
-                direction = -1
-            elif seg <= 0:
-                seg = 0
-                direction = 1
-            try:
-                # map segment count to value 0..255 so meter lighting follows mapping
-                if seg >= max_seg:
-                    v = 255
-                else:
-                    v = int(round(seg * (255.0 / float(max_seg))))
-                win.set_meter(v)
-            except Exception:
-                pass
+            if win.isMinimized() or not win.isVisible():
+                return
+            win.set_meter(next(test_seq))
 
         timer = QTimer()
+        timer.setInterval(1000)
         timer.timeout.connect(tick)
-        timer.start(1000)
+        timer.start()
         win._test_timer = timer
 
+        # the animation only runs while the window is shown (not minimized/hidden)
+        base_show_event = win.showEvent
+
+        def _show_event(event) -> None:
+            timer.start()
+            base_show_event(event)
+
+        def _hide_event(event) -> None:
+            timer.stop()
+            QWidget.hideEvent(win, event)
+
+        win.showEvent = _show_event
+        win.hideEvent = _hide_event
+
     return app.exec()
 
 
@@ -1621,56 +1677,17 @@ def main(argv: list[str] | None = None) -> int:
 #*------------------------------------------------------------------------------------
 
 def setMode(rig,mStr):
-  if mStr == "CW-U" or mStr == "CW":
-     rig.Mode =PM_CW_U
-     return
-  if mStr == "CW-L":
-     rig.Mode =PM_CW_L
-     return
-  if mStr == "USB":
-     rig.Mode =PM_USB
-     return
-  if mStr == "LSB":
-     rig.Mode =PM_LSB
+  mode = _MODE_FROM_STR.get(mStr)
+  if mode is None:
+     log.warning("ERROR. Mode %s not valida. Ignored", mStr)
      return
-  if mStr == "DIG-U":
-     rig.Mode =PM_DIG_U
-     return
-  if mStr == "DIG-L":
-     rig.Mode =PM_DIG_L
-     return
-  if mStr == "AM":
-     rig.Mode =PM_AM
-     return
-  if mStr == "FM":
-     rig.Mode =PM_FM
-     return
-  print(f"ERROR. Mode {mStr} not valida. Ignored")
+  with _com_lock:
+     rig.Mode = mode
 #*------------------------------------------------------------------------------------
 #* Translate mode coding into actual strings
 #*------------------------------------------------------------------------------------
 def getMode(m):
-
-  padding = 6
-  mode = m & 0xfff00000
-  #print(f"Recibio m({m:#0{padding}x}) mode({mode:#0{padding}x})  ") 
-  if mode == PM_CW_U:
-     return "CW-U"
-  if mode == PM_CW_L:
-     return "CW-L"
-  if mode == PM_USB:
-     return "USB"
-  if mode == PM_LSB:
-     return "LSB"
-  if mode == PM_DIG_U:
-     return "DIG-U"
-  if mode == PM_DIG_L:
-     return "DIG-L"
-  if mode == PM_AM:
-     return "AM"
-  if mode == PM_FM:
-     return "FM"
-  return "???"
+  return _MODE_MAP.get(m & _MODE_MASK, "???")
 
 
 
@@ -5,6 +5,6 @@ Minimal package entry. Version is exposed as __version__.
 
 __all__ = ["PyControl"]
 
-__version__ = "1.0.000"
+__version__ = "1.0.001"
 
 from .core import PyControl
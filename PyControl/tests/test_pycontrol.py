@@ -0,0 +1,81 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+APP = Path(__file__).resolve().parents[1] / "PyControl.py"
+
+
+@pytest.fixture(scope="module")
+def pc():
+    """PyControl.py loaded as a module; Qt and OmniRig are only needed by the GUI."""
+    spec = importlib.util.spec_from_file_location("PyControl_app", APP)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def test_load_cfg_skips_malformed_lines(pc, tmp_path):
+    ini = tmp_path / "PyControl.ini"
+    ini.write_text("RIG=rig1\nstray line\n  MODE=CW\n[x]\n# comment\n\nPOWER = 10\n")
+    assert pc._load_cfg(ini) == {"RIG": "rig1", "MODE": "CW", "POWER": "10"}
+
+
+def test_cfg_round_trip(pc, tmp_path):
+    ini = tmp_path / "PyControl.ini"
+    cfg = {"RIG": "rig2", "Mode": "USB", "POWER": "50"}
+    pc._store_cfg(ini, cfg)
+    assert pc._load_cfg(ini) == cfg
+
+
+def test_store_cfg_replaces_atomically(pc, tmp_path):
+    ini = tmp_path / "PyControl.ini"
+    ini.write_text("RIG=rig1\nOLD=1\n")
+    pc._store_cfg(ini, {"RIG": "rig2"})
+    assert ini.read_text() == "RIG=rig2\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["PyControl.ini"]
+
+
+def test_get_mode(pc):
+    for mode, name in pc._MODE_MAP.items():
+        assert pc.getMode(mode) == name
+        assert pc.getMode(mode | 0x1) == name    # bits outside _MODE_MASK are ignored
+    assert pc.getMode(0) == "???"
+
+
+def test_mode_from_str(pc):
+    for mode, name in pc._MODE_MAP.items():
+        assert pc._MODE_FROM_STR[name] == mode
+    assert pc._MODE_FROM_STR["CW"] == pc.PM_CW_U
+
+
+class _Rig:
+    Mode = None
+
+
+def test_set_mode(pc):
+    rig = _Rig()
+    pc.setMode(rig, "LSB")
+    assert rig.Mode == pc.PM_LSB
+    pc.setMode(rig, "CW")
+    assert rig.Mode == pc.PM_CW_U
+    pc.setMode(rig, "XYZ")                       # unknown modes are ignored
+    assert rig.Mode == pc.PM_CW_U
+
+
+class _Label:
+    def __init__(self):
+        self.text, self.calls = "", 0
+
+    def setText(self, s):
+        self.text, self.calls = s, self.calls + 1
+
+
+def test_set_freq(pc):
+    label = _Label()
+    pc._set_freq(label, 14070000)
+    assert label.text == "14,070,000 MHz"
+    pc._set_freq(label, 14070000)
+    assert label.calls == 1
+    pc._set_freq(label, 7074000)
+    assert (label.text, label.calls) == ("7,074,000 MHz", 2)
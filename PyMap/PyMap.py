@@ -27,6 +27,7 @@ import time
 import matplotlib.pyplot as plt
 import numpy as np
 from mpl_toolkits.basemap import Basemap
+from matplotlib.collections import LineCollection
 import datetime
 import zipfile
 import os
@@ -35,8 +36,10 @@ import tempfile
 import shutil
 import subprocess
 import imageio.v2 as imageio
-from collections import defaultdict
+from collections import defaultdict, deque
+from functools import lru_cache
 import json
+import pickle
 import maidenhead as mh
 from geopy.geocoders import Nominatim
 from pycountry_convert import country_alpha2_to_continent_code, convert_continent_code_to_continent_name
@@ -60,15 +63,35 @@ map=None
 path=None
 persist=3
 modeGraph="SHADED"
+
+# Cluster spot line, compiled once and matched against the uppercased line (one
+# upper() per line instead of one per field); any other line is rejected by the match
+_DX_LINE = re.compile(r'\s*DX\s+DE\s+(\S+?):?\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+DB\s+(\S+)\s+WPM\s+(\S+)\s+(\S+)')
 #*----------------------------------------------------------------------------------------------------------------
 #* This class stores and manages the list of spots for the previous {persist} minutes, it is used to draw
 #* the outstanding spots from the last period
 #*----------------------------------------------------------------------------------------------------------------
 class Rutas:
-    def __init__(self) -> None:
-        self._registros: List[Dict[str, Any]] = []
+    """
+    Spots are kept as columns (structure of arrays) in preallocated numpy arrays used as a ring buffer of
+    n_max entries (--max-spots) in arrival order, so the coordinates of the whole period are contiguous.
+    When the ring is full the oldest spot is overwritten, which is reported once until a purge makes room
+    """
+    N_MAX = 4096
+
+    def __init__(self, n_max: int = N_MAX) -> None:
+        self._n = n_max
+        self._lat_from = np.empty(n_max)
+        self._lon_from = np.empty(n_max)
+        self._lat_to = np.empty(n_max)
+        self._lon_to = np.empty(n_max)
+        self._ts = np.empty(n_max, dtype="datetime64[s]")
+        self._paises: List[tuple] = [("", "")] * n_max
+        self._inicio: int = 0
+        self._cant: int = 0
         self._resumen: List[Dict[str, Any]] = []
         self._posicion: int = 0
+        self._lleno: bool = False
 
     # -------------------------------------------------
     # Add a new register
@@ -89,24 +112,53 @@ class Rutas:
         segundo: int,
     ) -> None:
         """
-        Add a new register to an internal list (dict) structure.
+        Add a new register to the ring, when full the oldest one is overwritten.
+        Registers with an invalid date are ignored.
         """
-        self._registros.append(
-            {
-                "pais_origen": pais_origen,
-                "pais_destino": pais_destino,
-                "latitud_origen": latitud_origen,
-                "longitud_origen": longitud_origen,
-                "latitud_destino": latitud_destino,
-                "longitud_destino": longitud_destino,
-                "dia": dia,
-                "mes": mes,
-                "anio": anio,
-                "hora": hora,
-                "minuto": minuto,
-                "segundo": segundo,
-            }
-        )
+        try:
+            ts = np.datetime64(datetime.datetime(anio, mes, dia, hora, minuto, segundo), "s")
+        except ValueError:
+            return
+
+        if self._cant == self._n:
+            if not self._lleno:
+                self._lleno = True
+                print(f"[MAP] Spot history full ({self._n} spots), the oldest spots are being dropped",
+                      file=sys.stderr)
+            self._inicio = (self._inicio + 1) % self._n
+            self._cant -= 1
+
+        i = (self._inicio + self._cant) % self._n
+        self._paises[i] = (pais_origen, pais_destino)
+        self._lat_from[i] = latitud_origen
+        self._lon_from[i] = longitud_origen
+        self._lat_to[i] = latitud_destino
+        self._lon_to[i] = longitud_destino
+        self._ts[i] = ts
+        self._cant += 1
+
+    # -------------------------------------------------
+    # Slots in use, oldest first
+    # -------------------------------------------------
+    def _orden(self) -> np.ndarray:
+        return (self._inicio + np.arange(self._cant)) % self._n
+
+    def _registro(self, i: int) -> Dict[str, Any]:
+        ts = self._ts[i].item()
+        return {
+            "pais_origen": self._paises[i][0],
+            "pais_destino": self._paises[i][1],
+            "latitud_origen": float(self._lat_from[i]),
+            "longitud_origen": float(self._lon_from[i]),
+            "latitud_destino": float(self._lat_to[i]),
+            "longitud_destino": float(self._lon_to[i]),
+            "dia": ts.day,
+            "mes": ts.month,
+            "anio": ts.year,
+            "hora": ts.hour,
+            "minuto": ts.minute,
+            "segundo": ts.second,
+        }
 
     # -------------------------------------------------
     # clear the list
@@ -115,7 +167,9 @@ class Rutas:
         """
         Borra todos los registros y resetea el estado interno.
         """
-        self._registros.clear()
+        self._inicio = 0
+        self._cant = 0
+        self._lleno = False
         self._resumen.clear()
         self._posicion = 0
 
@@ -127,27 +181,16 @@ class Rutas:
         contador = defaultdict(int)
         primeros_datos: Dict[tuple, Dict[str, Any]] = {}
 
-        for r in self._registros:
+        for i in self._orden():
             # Take country tuples in any order
 
-            clave = tuple(sorted([r["pais_origen"], r["pais_destino"]]))
+            clave = tuple(sorted(self._paises[i]))
             contador[clave] += 1
 
             # First record
 
             if clave not in primeros_datos:
-                primeros_datos[clave] = {
-                    "latitud_origen": r["latitud_origen"],
-                    "longitud_origen": r["longitud_origen"],
-                    "latitud_destino": r["latitud_destino"],
-                    "longitud_destino": r["longitud_destino"],
-                    "dia": r["dia"],
-                    "mes": r["mes"],
-                    "anio": r["anio"],
-                    "hora": r["hora"],
-                    "minuto": r["minuto"],
-                    "segundo": r["segundo"],
-                }
+                primeros_datos[clave] = self._registro(i)
 
         resumen: List[Dict[str, Any]] = []
 
@@ -188,17 +231,9 @@ class Rutas:
     # ---------------------------
     def print(self) -> List[Dict[str, Any]]:
 
-        return sorted(
-            self._registros,
-            key=lambda r: (
-                r["anio"],
-                r["mes"],
-                r["dia"],
-                r["hora"],
-                r["minuto"],
-                r["segundo"],
-            ),
-        )
+        orden = self._orden()
+        orden = orden[np.argsort(self._ts[orden], kind="stable")]
+        return [self._registro(i) for i in orden]
 
     # ---------------------------
     # Orderly recovery of list
@@ -263,30 +298,23 @@ class Rutas:
     # ---------------------------
     def purge(self, minutos: int) -> None:
 
-        now = datetime.datetime.now()
-        limite = datetime.timedelta(minutes=minutos)
-
-        nueva_lista: List[Dict[str, Any]] = []
-
-        for r in self._registros:
-            try:
-                ts = datetime.datetime(
-                    r["anio"],
-                    r["mes"],
-                    r["dia"],
-                    r["hora"],
-                    r["minuto"],
-                    r["segundo"],
-                )
-            except ValueError:
-                continue
-
-            diferencia = now - ts
+        limite = np.datetime64(datetime.datetime.now() - datetime.timedelta(minutes=minutos), "s")
 
-            if diferencia <= limite:
-                nueva_lista.append(r)
+        # Timestamps are local wall clock time (DST changes, clock corrections), so the ring is not
+        # assumed to be in time order: every spot is compared and the survivors are moved to its start
 
-        self._registros = nueva_lista
+        orden = self._orden()
+        vigentes = orden[self._ts[orden] >= limite]
+        if len(vigentes) == self._cant:
+            return
+        k = len(vigentes)
+        for col in (self._lat_from, self._lon_from, self._lat_to, self._lon_to, self._ts):
+            col[:k] = col[vigentes]
+        paises = [self._paises[i] for i in vigentes]
+        self._paises[:k] = paises
+        self._inicio = 0
+        self._cant = k
+        self._lleno = False
 
 
 #*-----------------------------------------------------------------------------
@@ -326,38 +354,24 @@ async def handle_local_client(reader: asyncio.StreamReader,
         print(f"[LOCAL] Client disconnected {peername}", file=sys.stderr)
 
 #*---------------------------------------------------------------------------------------------------------------
-#* Change frequency to band
+#* Change frequency (kHz) to band, unknown frequencies map to 0
 #*---------------------------------------------------------------------------------------------------------------
-def freq2band(freq):
+_BAND = {432:"70cm", 144:"2m", 50:"6m", 28:"10m", 24:"12m", 21:"15m", 18:"17m", 14:"20m",
+         10:"30m", 7:"40m", 3:"80m", 1:"160m"}
 
-    f=int(float(freq))
+def freq2band(freq):
     try:
-      if int(f/1000) == 432:
-         return "70cm"
-      if int(f/1000) == 144:
-         return "2m"
-      if int(f/1000) == 50:
-         return "6m"
-      if int(f/1000) == 28:
-         return "10m"
-      if int(f/1000) == 24:
-         return "12m"
-      if int(f/1000) == 21:
-         return "15m"
-      if int(f/1000) == 18:
-         return "17m"
-      if int(f/1000) == 14:
-         return "20m"
-      if int(f/1000) == 10:
-         return "30m"
-      if int(f/1000) == 7:
-         return "40m"
-      if int(f/1000) == 3:
-         return "80m"
-      if int(f/1000) == 1:
-         return "160m"
-    except:
-         return 0  
+       return _BAND.get(int(float(freq))//1000, 0)
+    except ValueError:
+       return 0
+#*-------------------------------------------------------------------------------------------------------------
+#* Callsign lookup, spots keep repeating the same clusters and DX so the country file is queried once per
+#* callsign; a failed lookup raises and lru_cache does not store it, so it is retried on the next spot
+#*-------------------------------------------------------------------------------------------------------------
+@lru_cache(maxsize=4096)
+def _get_info(cs: str):
+    return cic.get_all(cs)
+
 #*-------------------------------------------------------------------------------------------------------------
 #* Repeat spots to all connected Telnet clients
 #*-------------------------------------------------------------------------------------------------------------
@@ -368,10 +382,11 @@ async def broadcast_to_clients(message: str) -> None:
     async with clients_lock:
         if not connected_clients:
             return
+        payload = (message + "\n").encode(errors="ignore")   # same bytes for every client
         dead_clients = []
         for w in connected_clients:
             try:
-                w.write((message + "\n").encode(errors="ignore"))
+                w.write(payload)
             except Exception:
                 dead_clients.append(w)
 
@@ -398,34 +413,79 @@ async def broadcast_to_clients(message: str) -> None:
 def parse_dx_line(line: str):
     """
     Parsed the line from the cluster:
-        DX DE {FROM} {FREQ} {CALLSIGN} {MODE} ...
-    using spaces or tabs as separators.
+        DX DE {FROM}: {FREQ} {CALLSIGN} {MODE} {SNR} dB {SPEED} WPM {ACTIVITY} {TIME}
+    using spaces or tabs as separators; fields are returned in uppercase.
     """
-    # Split according with separator
-    tokens = re.split(r'\s+', line.strip())
-    if len(tokens) < 6:
+    m = _DX_LINE.match(line.upper())
+    if m is None:
         return None
-
-    if tokens[0].upper() != "DX" or tokens[1].upper() != "DE":
-        return None
-
-    from_ = tokens[2].upper()
-    freq = tokens[3].upper()
-    callsign = tokens[4].upper()
-    mode = tokens[5].upper()
-    speed = tokens[8].upper()
-    snr=tokens[6].upper()
-    activity=tokens[10].upper()
-    timestamp=tokens[11].upper()
+    from_, freq, callsign, mode, snr, speed, activity, timestamp = m.groups()
     return from_, freq, callsign, mode,speed,snr,activity,timestamp
 
 
 #*------------------------------------------------------------------------------------------------------
 #* Build a map (Mercator projection)
+#* Loading the coastline polygons is the slow part of Basemap(), so the instance is built once and pickled
+#* keyed by its parameters into a per-user cache directory (never a shared one such as /tmp, a planted
+#* pickle would run code as this user); the draw calls still run on every (re)built figure
 #*------------------------------------------------------------------------------------------------------
+_MAP_ARGS = dict(projection='merc',llcrnrlon=-170,llcrnrlat=-75,urcrnrlon=170,urcrnrlat=75,resolution='l')
+_basemap = None
+
+def mapCacheDir():
+    """
+    Directory for the pickled Basemap, None when there is no private place to keep it
+    """
+    if os.name == "nt":
+       base = os.environ.get("LOCALAPPDATA")
+    else:
+       base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    if not base:
+       return None
+    d = os.path.join(base, "pymap")
+    try:
+       os.makedirs(d, mode=0o700, exist_ok=True)
+       if os.name != "nt":
+          st = os.stat(d)
+          if st.st_uid != os.getuid() or st.st_mode & 0o022:
+             return None
+    except OSError:
+       return None
+    return d
+
+def getBasemap():
+    global _basemap
+    if _basemap is not None:
+       return _basemap
+    a=_MAP_ARGS
+    d=mapCacheDir()
+    pkl=None
+    if d is not None:
+       pkl=os.path.join(d,
+           f"basemap_{a['projection']}_{a['llcrnrlon']}_{a['llcrnrlat']}_{a['urcrnrlon']}_{a['urcrnrlat']}_{a['resolution']}.pkl")
+       try:
+          with open(pkl,"rb") as fp:
+             _basemap = pickle.load(fp)
+          return _basemap
+       except Exception:
+          pass                                  #*--- missing, truncated or stale cache: build it
+
+    _basemap = Basemap(**a)
+    if pkl is not None:
+       tmp=None
+       try:
+          fd,tmp = tempfile.mkstemp(dir=d, suffix=".tmp")
+          with os.fdopen(fd,"wb") as fp:
+             pickle.dump(_basemap,fp,pickle.HIGHEST_PROTOCOL)
+          os.replace(tmp,pkl)                   #*--- readers never see a partially written file
+       except Exception as exc:
+          print(f"Basemap cache {pkl} can not be written: {exc}", file=sys.stderr)
+          if tmp is not None and os.path.exists(tmp):
+             os.remove(tmp)
+    return _basemap
 
 def buildMap():
-    m = Basemap(projection='merc',llcrnrlon=-170,llcrnrlat=-75,urcrnrlon=170,urcrnrlat=75,resolution='l')
+    m = getBasemap()
     m.drawmeridians(np.arange(0,360,30))
     m.drawparallels(np.arange(-90,90,30))
     m.drawcoastlines(linewidth=0.25)
@@ -459,25 +519,118 @@ def drawMap(yy,mm,dd,h,m,band,filter_callsign):
 
     title=f"PyMap {dd:0{2}d}-{mm:0{2}d}-{yy}  {h:0{2}d}:{m:0{2}d}\n Band({band}) Filter({filter_callsign})"
     plt.title(title)
+    newOverlay()
     return map
 
 #*------------------------------------------------------------------------------------------------------
-#* get Current Time
+#* Spot overlay, all spots on the map are segments of a single LineCollection which redraw_task pushes
+#* to the figure when woken by a new spot, at most once every REDRAW_MS, instead of adding a Line2D and
+#* pumping the GUI on every spot. Spots are queued unprojected and the whole batch goes through the
+#* projection in one call per redraw; while idle the task just keeps the GUI events flowing.
+#* redraw_task is the only place that draws, the map is also rebuilt there when a new minute starts, so
+#* the network reader only queues spots and never waits for matplotlib.
+#* The end points of every spot are kept as markers (the 'o-' style of the former per spot plot) in one
+#* scatter collection refreshed together with the segments
 #*------------------------------------------------------------------------------------------------------
-def getTime():
+REDRAW_MS=100
+SPOT_QUEUE=5000
+_spots_lc=None
+_ends_pc=None
+_pending=deque(maxlen=SPOT_QUEUE)
+_segs=[]
+_colors=[]
+_ends=[]
+_end_colors=[]
+_redraw=asyncio.Event()
+
+def newOverlay():
+    global _spots_lc,_ends_pc
+    _pending.clear()
+    _segs.clear()
+    _colors.clear()
+    _ends.clear()
+    _end_colors.clear()
+    _spots_lc=LineCollection([], linewidths=1)
+    _spots_lc.set_rasterized(True)            #*--- spots as one bitmap layer, map and axes stay vector
+    plt.gca().add_collection(_spots_lc)
+    _ends_pc=plt.gca().scatter([], [], s=1, marker='o')    #*--- s is in points^2, same as markersize=1
+    _ends_pc.set_rasterized(True)
+    _redraw.set()
+
+def addSpot(latFrom,lonFrom,latTo,lonTo,color):
+    _pending.append((lonFrom,latFrom,lonTo,latTo,color))
+    _redraw.set()
+
+def projectPending():
+    if not _pending:
+       return
+    lonFrom,latFrom,lonTo,latTo,colors = zip(*_pending)
+    _pending.clear()
+    m = getBasemap()
+    x0,y0 = m(np.asarray(lonFrom), np.asarray(latFrom))
+    x1,y1 = m(np.asarray(lonTo), np.asarray(latTo))
+    p0 = np.column_stack((x0,y0))
+    p1 = np.column_stack((x1,y1))
+    _segs.extend(np.stack((p0, p1), axis=1))
+    _colors.extend(colors)
+    _ends.extend(p0)
+    _ends.extend(p1)
+    _end_colors.extend(colors)
+    _end_colors.extend(colors)
+
+async def redraw_task(band,filter_callsign,mant):
+    global map
+    fig=plt.gcf()
+    while True:
+
+        #*--- A failed redraw is reported and the loop goes on, otherwise the map would silently freeze
+        #*--- while spots keep being queued
+
+        try:
+
+            #*--- Check if a new minute has elapsed
+
+            yy,mm,dd,h,m = getTime()
+            if m != mant:
+               mant=m
+               map=drawMap(yy,mm,dd,h,m,band,filter_callsign)
+               if path is not None:
+                  path.purge(persist)
+                  walkPath(path,map)
 
-    from datetime import datetime, date
-    now   = datetime.now()
-    fdate = now.strftime("%Y-%m-%d")
-    ftime = now.strftime("%H:%M:%S")
+            try:
+               await asyncio.wait_for(_redraw.wait(), REDRAW_MS/1000)
+            except asyncio.TimeoutError:
+               fig.canvas.flush_events()
+               continue
+            _redraw.clear()
+            projectPending()
+            if _segs:
+               _spots_lc.set_segments(_segs)
+               _spots_lc.set_color(_colors)
+               _ends_pc.set_offsets(_ends)
+               _ends_pc.set_color(_end_colors)
+            fig.canvas.draw_idle()
+            fig.canvas.flush_events()
+            await asyncio.sleep(REDRAW_MS/1000)   #*--- spots arriving meanwhile share the next redraw
+
+        except Exception as exc:
+            print(f"[MAP] Redraw error: {exc!r}", file=sys.stderr)
+            await asyncio.sleep(REDRAW_MS/1000)
 
-    yy=int(fdate.split("-")[0])    #
-    mm=int(fdate.split("-")[1])    #
-    dd=int(fdate.split("-")[2])    #
-    h=int(ftime.split(":")[0])     #
-    m=int(ftime.split(":")[1])     #
+#*------------------------------------------------------------------------------------------------------
+#* get Current Time
+#*------------------------------------------------------------------------------------------------------
+_now_minute = [None, None]      #*--- epoch minute and its local (yy,mm,dd,h,m)
 
-    return yy,mm,dd,h,m
+def getTime():
+    """Local (yy,mm,dd,h,m); called once per spot, so the fields are rebuilt
+    numerically only when the minute changes."""
+    t = int(time.time()) // 60
+    if t != _now_minute[0]:
+       lt = time.localtime(t * 60)
+       _now_minute[:] = t, (lt.tm_year, lt.tm_mon, lt.tm_mday, lt.tm_hour, lt.tm_min)
+    return _now_minute[1]
 
 #*------------------------------------------------------------------------------------------------------
 #* Walk the (purged) structure of spots and draw the paths
@@ -492,10 +645,6 @@ def walkPath(path,map):
 
      while countryFrom != "": 
 
-         lat = [latFrom,latTo]
-         lon = [lonFrom,lonTo]
-         x,y = map(lon, lat)
-
          spot_timestamp = datetime(anio,mes,dia, hora, min, seg)
 
          time_difference = spot_timestamp - now
@@ -503,14 +652,31 @@ def walkPath(path,map):
          dmin = int(tsecs // 60)
          dmin = abs(dmin)
          r="blue"
-         map.plot(x, y, 'o-', color=r,markersize=1, linewidth=1)
-         plt.show(block=False)
-         #plt.pause(0.001)
+         addSpot(latFrom,lonFrom,latTo,lonTo,r)
 
          # Obtener siguiente
          (countryFrom, countryTo, cant, latFrom, lonFrom, latTo, lonTo, dia, mes, anio, hora, min, seg) = path.next()
 
 
+#*-----------------------------------------------------------------------------------------------------------
+#* Lines from the cluster, read in bulk (READ_CHUNK bytes per call) and split locally rather than resuming
+#* the reader once per line; a partial trailing line is kept for the next read
+#*-----------------------------------------------------------------------------------------------------------
+READ_CHUNK=65536
+
+async def read_lines(reader: asyncio.StreamReader):
+    buf = b""
+    while True:
+        chunk = await reader.read(READ_CHUNK)
+        if not chunk:
+            if buf:
+                yield buf
+            print("[REMOTE] Remote connection closed.", file=sys.stderr)
+            return
+        *lines, buf = (buf + chunk).split(b"\n")
+        for data in lines:
+            yield data
+
 #*------------------------------------------------------------------------------------------------------
 #* Connect to the cluster telnet server and handles the spots
 #*------------------------------------------------------------------------------------------------------
@@ -520,7 +686,8 @@ async def remote_client_task(host: str,
                              response: str,
                              filter_callsign: str,
                              init_string: str,
-                             band: str) -> None:
+                             band: str,
+                             max_spots: int = Rutas.N_MAX) -> None:
     """
     Connection to the cluster telnet server.
     - Upon connection send an initial string
@@ -562,29 +729,15 @@ async def remote_client_task(host: str,
 
     # Create structure to held one minute worth of location spots
 
-    mant=-1
-    path=Rutas()
-
-
-    # Main loop receive, process and filter spots
-
-    try:
-        while True:
+    path=Rutas(max_spots)
 
-            #*--- Check if a new minute has elapsed
 
-            yy,mm,dd,h,m = getTime()
-            if m != mant:
-               mant=m
-               map=drawMap(yy,mm,dd,h,m,band,filter_callsign)
-               path.purge(persist)
-               walkPath(path,map)
+    # Main loop receive, process and filter spots, parse_dx_line already returns the fields in uppercase
 
+    filter_u = filter_callsign.upper()
 
-            data = await reader.readline()
-            if not data:
-                print("[REMOTE] Remote connection closed.", file=sys.stderr)
-                break
+    try:
+        async for data in read_lines(reader):
 
             line = data.decode(errors="ignore").rstrip("\r\n")
 
@@ -597,6 +750,13 @@ async def remote_client_task(host: str,
 
             from_, freq, callsign, mode, speed, snr, activity, timestamp = parsed
 
+            # Filter callsign and band before any formatting or lookup
+
+            if filter_callsign != "*" and callsign != filter_u:
+                continue
+
+            if band != freq2band(freq):
+               continue
 
             # If pass the filter show at stdout and send to clients
 
@@ -604,21 +764,7 @@ async def remote_client_task(host: str,
             spot=f"DX de {cluster}:"
             spot=spot.ljust(15)
             f=freq.rjust(9)
-
-            fx=int(float(f))
-            if band != freq2band(fx):
-               continue
-
-            # Filter callsign
-
-            if filter_callsign != "*" and callsign.upper() != filter_callsign.upper():
-                plt.show(block=False)
-                plt.pause(0.001)
-                continue
-
-
-            cl=f"{callsign.upper()}"
-            cl=cl.replace("#","")
+            cl=callsign.replace("#","")
             cl=cl.ljust(13)
             snr=snr.rjust(2)
             snr=f"{snr} dB"
@@ -635,10 +781,10 @@ async def remote_client_task(host: str,
             #*--------------------------------------------------------------------------------
 
             try:
-               o=cic.get_all(cluster.upper())
-               z=cic.get_all(callsign.upper())
+               o=_get_info(cluster)
+               z=_get_info(callsign)
             except:
-               print(f"Callsign {cluster.upper()} or {callsign.upper()} can not be decoded")
+               print(f"Callsign {cluster} or {callsign} can not be decoded")
                continue
 
             laFrom=float(o['latitude'])
@@ -647,9 +793,6 @@ async def remote_client_task(host: str,
             laTo=float(z['latitude']) 
             loTo=float(z['longitude']) 
 
-            lat = [laFrom,laTo]
-            lon = [loFrom,loTo]
-
             countryFrom=o['country']
             countryTo=z['country']
 
@@ -665,12 +808,10 @@ async def remote_client_task(host: str,
 
             r="r"
 
-            x,y = map(lon, lat)
-            map.plot(x, y, 'o-', color=r,markersize=1, linewidth=1) #*--- Store the fresh spot, always in red
-
-            plt.show(block=False)
-            plt.pause(0.001)
+            addSpot(laFrom,loFrom,laTo,loTo,r) #*--- Store the fresh spot, always in red
+            await asyncio.sleep(0)
 
+            yy,mm,dd,h,m = getTime()
             path.add(countryFrom,countryTo,laFrom,loFrom,laTo,loTo,dd,mm,yy,h,m,0)
 
             await broadcast_to_clients(newline)
@@ -718,6 +859,7 @@ async def main_async(args):
             filter_callsign=args.filter_callsign,
             init_string=args.init_string,
             band=args.band,
+            max_spots=args.max_spots,
         )
     )
 
@@ -727,6 +869,8 @@ async def main_async(args):
 
     yy,mm,dd,h,m = getTime()
     map=drawMap(yy,mm,dd,h,m,args.band,args.filter_callsign)
+    plt.show(block=False)
+    redraw = asyncio.create_task(redraw_task(args.band,args.filter_callsign,m))
 
 
     # While connected to the cluster accept local telnet connections.
@@ -738,6 +882,7 @@ async def main_async(args):
         # When the cluster disconnect all local clients disconnects too
         server.close()
         await server.wait_closed()
+        redraw.cancel()
         async with clients_lock:
             for w in list(connected_clients):
                 try:
@@ -807,6 +952,12 @@ def parse_args():
         type=int,
         help="Persistence of the spot on the map"
     )
+    parser.add_argument(
+        "--max-spots",
+        type=int,
+        default=Rutas.N_MAX,
+        help=f"Spots kept for the persistence period, the oldest are dropped beyond it (default {Rutas.N_MAX})"
+    )
     parser.add_argument(
         "--graph",
         type=str,
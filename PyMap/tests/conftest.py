@@ -0,0 +1,28 @@
+"""Load the PyMap and dx_proxy scripts as modules; tests are skipped when a
+script's dependencies (numpy, matplotlib/basemap, pyhamtools, ...) are missing."""
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parents[2]
+
+
+def _load(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    mod = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(mod)
+    except (ImportError, OSError) as exc:
+        pytest.skip(f"{name} can not be loaded here: {exc}")
+    return mod
+
+
+@pytest.fixture(scope="session")
+def pymap():
+    return _load("PyMap", REPO / "PyMap" / "PyMap.py")
+
+
+@pytest.fixture(scope="session")
+def dx_proxy():
+    return _load("dx_proxy", REPO / "dx_proxy" / "dx_proxy.py")
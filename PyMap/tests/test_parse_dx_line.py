@@ -0,0 +1,44 @@
+import pytest
+
+# PyMap and dx_proxy carry the same parser, both copies must behave the same
+PARSERS = ("pymap", "dx_proxy")
+
+
+@pytest.fixture(params=PARSERS)
+def parse(request):
+    return request.getfixturevalue(request.param).parse_dx_line
+
+
+def test_rbn_spot(parse):
+    line = "DX de KM3T-#:     14025.0  LU7DZ        CW    18 dB  25 WPM  CQ      1329Z"
+    assert parse(line) == ("KM3T-#", "14025.0", "LU7DZ", "CW", "25", "18", "CQ", "1329Z")
+
+
+def test_from_without_ssid_drops_colon(parse):
+    # the FROM field is returned without its trailing ':'
+    line = "DX de W3LPL:  7025.0  K1ABC  CW  9 dB  22 WPM  CQ  0001Z"
+    assert parse(line)[0] == "W3LPL"
+
+
+def test_lowercase_input_is_uppercased(parse):
+    line = "dx de lu2eic-#:  28024.7 lu7dz  cw  5 db 29 wpm cq 1329z"
+    assert parse(line) == ("LU2EIC-#", "28024.7", "LU7DZ", "CW", "29", "5", "CQ", "1329Z")
+
+
+@pytest.mark.parametrize("line", [
+    "DX de W3LPL: 14025.0 K1ABC",
+    "DX de W3LPL: 14025.0 K1ABC CW 9 dB 22",
+    "DX de",
+])
+def test_short_spot_lines_are_rejected(parse, line):
+    assert parse(line) is None
+
+
+@pytest.mark.parametrize("line", [
+    "",
+    "WWV de W0MU <18>:   SFI=150, A=5, K=1, No Storms -> No Storms",
+    "To ALL de LU7DZ: hello",
+    "Please enter your call:",
+])
+def test_non_spot_lines_are_rejected(parse, line):
+    assert parse(line) is None
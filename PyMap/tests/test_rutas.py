@@ -0,0 +1,48 @@
+import datetime
+
+
+def _add(r, pais_origen, pais_destino, ts, lat=1.0):
+    r.add(pais_origen, pais_destino, lat, 2.0, 3.0, 4.0,
+          ts.day, ts.month, ts.year, ts.hour, ts.minute, ts.second)
+
+
+def _now():
+    return datetime.datetime.now().replace(microsecond=0)
+
+
+def test_add_and_count(pymap):
+    r = pymap.Rutas(8)
+    now = _now()
+    _add(r, "Argentina", "Brazil", now)
+    _add(r, "Brazil", "Argentina", now, lat=9.0)
+    _add(r, "Argentina", "Chile", now)
+    resumen = r.count()
+    assert [(x["pais_1"], x["pais_2"], x["cantidad"]) for x in resumen] == [
+        ("Argentina", "Brazil", 2),
+        ("Argentina", "Chile", 1),
+    ]
+    # the first spot of each country pair provides the coordinates and time
+    assert resumen[0]["latitud_origen"] == 1.0
+    assert (resumen[0]["hora"], resumen[0]["minuto"]) == (now.hour, now.minute)
+
+
+def test_purge_does_not_assume_time_order(pymap):
+    r = pymap.Rutas(8)
+    now = _now()
+    # an old timestamp after recent ones, as after a DST fall-back or a clock correction
+    _add(r, "A", "B", now)
+    _add(r, "C", "D", now - datetime.timedelta(minutes=30))
+    _add(r, "E", "F", now)
+    r.purge(5)
+    assert [(x["pais_origen"], x["pais_destino"]) for x in r.print()] == [("A", "B"), ("E", "F")]
+    _add(r, "G", "H", now)
+    assert len(r.count()) == 3
+
+
+def test_full_ring_drops_oldest(pymap, capsys):
+    r = pymap.Rutas(2)
+    now = _now()
+    for pais in ("A", "B", "C"):
+        _add(r, pais, "Z", now)
+    assert [x["pais_origen"] for x in r.print()] == ["B", "C"]
+    assert "full" in capsys.readouterr().err
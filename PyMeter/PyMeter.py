@@ -29,8 +29,8 @@ import sys
 
 
 
-from PyQt5.QtCore import Qt, QSize, QTimer, QEvent
-from PyQt5.QtGui import QPainter, QColor, QPen
+from PyQt5.QtCore import Qt, QSize, QTimer, QEvent, QRect, pyqtSlot
+from PyQt5.QtGui import QPainter, QColor, QPen, QBrush
 from PyQt5.QtWidgets import (
     QApplication,
     QWidget,
@@ -106,8 +106,9 @@ class VUMeter(QWidget):
         if segments <= 0:
             raise ValueError("segments must be > 0")
         self._segments = segments
-        # number of lit segments (1..segments)
+        # raw value (0..255) and the number of lit segments it maps to (0..segments)
         self._value = 0
+        self._lit = 0
         # target LED diameter (matches LedIndicator default)
         self._led_diameter = int(led_diameter)
         # compute a sensible minimum size so LEDs are visible
@@ -117,19 +118,49 @@ class VUMeter(QWidget):
         # precompute band mapping: distribution for 15 LEDs -> 9 green, 4 yellow, 2 red
         # this allows precise control over colors per LED
         if self._segments == 15:
-            self._bands = (['green'] * 9) + (['yellow'] * 4) + (['red'] * 2)
+            bands = (['green'] * 9) + (['yellow'] * 4) + (['red'] * 2)
         else:
             # fallback to original 5/3/2 for other sizes
-            self._bands = (['green'] * 5) + (['yellow'] * 3) + (['red'] * 2)
+            bands = (['green'] * 5) + (['yellow'] * 3) + (['red'] * 2)
+        # per segment on/off brushes, built once so paintEvent only picks them
+        self._on_brushes: list[QBrush] = []
+        self._off_brushes: list[QBrush] = []
+        for i in range(self._segments):
+            frac = i / max(1, self._segments - 1)
+            band = bands[i] if i < len(bands) else ("green" if frac < 0.4 else ("yellow" if frac < 0.75 else "red"))
+            on_color, off_color = self._colors_for_band(band)
+            self._on_brushes.append(QBrush(on_color))
+            self._off_brushes.append(QBrush(off_color))
+        self._pen = QPen(Qt.black, 1)
+        # segment rectangles, recomputed on resize (see _layout)
+        self._rects: list[QRect] = []
+        self._radius = max(1, int(max(2, self._led_diameter) / 2))
         self.setSizePolicy(QSizePolicy.MinimumExpanding, QSizePolicy.MinimumExpanding)
         # whether the meter is enabled (online). When disabled, all LEDs show off colors
 
         self._enabled = True
+        self._layout()
+
+    def _layout(self) -> None:
+        """Compute the rectangle of every segment for the current widget height."""
+        # Use a small gap between LEDs so they are very close but not touching
+        gap = 2
+        d = max(2, self._led_diameter)
+        # align the row to the left (small left margin) so LEDs start under the Signal label
+        start_x = 4
+        # vertically center LEDs
+        y = int((self.height() - d) / 2)
+        self._rects = [QRect(start_x + i * (d + gap), y, d, d) for i in range(self._segments)]
+
+    def resizeEvent(self, event) -> None:  # pragma: no cover - GUI helper
+        self._layout()
+        super().resizeEvent(event)
 
     def sizeHint(self) -> QSize:  # pragma: no cover - GUI helper
         # prefer a compact square-like hint based on led diameter
         return QSize((self._led_diameter + 2) * self._segments + 16, self._led_diameter + 20)
 
+    @pyqtSlot(int)
     def set_value(self, value: int) -> None:
         """Set meter value in 0..255 and refresh display.
 
@@ -149,52 +180,34 @@ class VUMeter(QWidget):
             v = 0
         elif v > 255:
             v = 255
-        if v != self._value:
-            self._value = v
+        self._value = v
+        # only 0..segments levels are visible, repaint when the lit count changes
+        lit = self._lit_count(v)
+        if lit != self._lit:
+            self._lit = lit
             self.update()
 
+    def _lit_count(self, value: int) -> int:
+        """Map a 0..255 value to the number of lit segments (0..segments)."""
+        # 255 always maps to full segments
+        if value >= 255:
+            return self._segments
+        lit_count = int(value / (255.0 / float(self._segments)))
+        return max(0, min(self._segments, lit_count))
+
     def paintEvent(self, event) -> None:  # pragma: no cover - painting
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
-        w = self.width()
-        h = self.height()
-        # Use a small gap between LEDs so they are very close but not touching
-        gap = 2
-        d = max(2, self._led_diameter)
-        total_w = self._segments * d + (self._segments - 1) * gap
-        # align the row to the left (small left margin) so LEDs start under the Signal label
-        start_x = 4
-        # vertically center LEDs
-        y = int((h - d) / 2)
-        # map 0..255 to number of lit segments (0..self._segments)
-        try:
-            bucket = 255.0 / float(self._segments)
-            lit_count = int(self._value / bucket)
-        except Exception:
-            lit_count = int(max(0, min(self._segments, int(self._value))))
-        # ensure bounds and ensure 255 maps to full segments
-        if self._value >= 255:
-            lit_count = self._segments
-        lit_count = max(0, min(self._segments, lit_count))
-
-        for i in range(self._segments):
-            x = start_x + i * (d + gap)
-            rect_w = int(d)
-            rect_h = int(d)
-            frac = i / max(1, self._segments - 1)
-            # determine band from explicit mapping to ensure 5/3/2 distribution
-            band = self._bands[i] if i < len(self._bands) else ("green" if frac < 0.4 else ("yellow" if frac < 0.75 else "red"))
-            on_color, off_color = self._colors_for_band(band)
-            # If meter is disabled (offline) always show off colors
-            if not getattr(self, "_enabled", True):
-                brush_color = off_color
-            else:
-                brush_color = on_color if i < lit_count else off_color
-            painter.setPen(QPen(Qt.black, 1))
-            painter.setBrush(brush_color)
+        # If meter is disabled (offline) always show off colors
+        lit_count = self._lit if self._enabled else 0
+
+        painter.setPen(self._pen)
+        r = self._radius
+        on, off = self._on_brushes, self._off_brushes
+        for i, rect in enumerate(self._rects):
+            painter.setBrush(on[i] if i < lit_count else off[i])
             # draw rounded rect with radius half the diameter for pill/circle appearance
-            r = max(1, int(d / 2))
-            painter.drawRoundedRect(x, y, rect_w, rect_h, r, r)
+            painter.drawRoundedRect(rect, r, r)
 
     @staticmethod
     def _colors_for_fraction(frac: float) -> tuple[QColor, QColor]:
@@ -230,31 +243,48 @@ class VUMeter(QWidget):
 class LedIndicator(QWidget):
     """Simple circular LED indicator. Use set_on(True/False)."""
 
-    def __init__(self, diameter: int = 8, color_on: Tuple[int, int, int] = (0, 255, 0), parent: QWidget | None = None) -> None:
+    def __init__(self, diameter: int = 8, color_on: Tuple[int, int, int] | QColor = (0, 255, 0), parent: QWidget | None = None,
+                 color_off: Tuple[int, int, int] | QColor = (80, 80, 80), on: bool = False) -> None:
         super().__init__(parent)
-        self._on = False
+        # initial state is stored directly (no setter calls, no update() before the first paint)
+        self._on = bool(on)
         self._diameter = diameter
-        self._color_on = QColor(*color_on)
+        self._color_on = color_on if isinstance(color_on, QColor) else QColor(*color_on)
         # default off color is neutral gray; can be changed with set_color_off
-        self._color_off = QColor(80, 80, 80)
+        self._color_off = color_off if isinstance(color_off, QColor) else QColor(*color_off)
         self.setFixedSize(QSize(diameter + 4, diameter + 4))
 
     def set_on(self, state: bool) -> None:
-        self._on = bool(state)
+        state = bool(state)
+        if state == self._on:
+            return
+        self._on = state
         self.update()
 
     def is_on(self) -> bool:
         return self._on
 
-    def set_color_on(self, color: Tuple[int, int, int]) -> None:
-        """Change the 'on' color for the indicator and refresh."""
-        self._color_on = QColor(*color)
-        self.update()
+    def set_color_on(self, color: Tuple[int, int, int] | QColor) -> None:
+        """Change the 'on' color for the indicator and refresh.
 
-    def set_color_off(self, color: Tuple[int, int, int]) -> None:
-        """Change the 'off' (dim) color for the indicator and refresh."""
-        self._color_off = QColor(*color)
-        self.update()
+        A prebuilt QColor is used as is, avoiding a new QColor per call. A repaint
+        is only requested when the LED is on and the color actually changes.
+        """
+        color = color if isinstance(color, QColor) else QColor(*color)
+        if color == self._color_on:
+            return
+        self._color_on = color
+        if self._on:
+            self.update()
+
+    def set_color_off(self, color: Tuple[int, int, int] | QColor) -> None:
+        """Change the 'off' (dim) color for the indicator and refresh if it shows."""
+        color = color if isinstance(color, QColor) else QColor(*color)
+        if color == self._color_off:
+            return
+        self._color_off = color
+        if not self._on:
+            self.update()
 
     def paintEvent(self, event) -> None:  # pragma: no cover - painting
         painter = QPainter(self)
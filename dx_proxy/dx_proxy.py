@@ -40,6 +40,10 @@ from typing import Set
 connected_clients: Set[asyncio.StreamWriter] = set()
 clients_lock = asyncio.Lock()
 
+# Cluster spot line, compiled once and matched against the uppercased line (one
+# upper() per line instead of one per field); any other line is rejected by the match
+_DX_LINE = re.compile(r'\s*DX\s+DE\s+(\S+?):?\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+DB\s+(\S+)\s+WPM\s+(\S+)\s+(\S+)')
+
 #*-----------------------------------------------------------------------------
 async def handle_local_client(reader: asyncio.StreamReader,
                               writer: asyncio.StreamWriter) -> None:
@@ -82,10 +86,11 @@ async def broadcast_to_clients(message: str) -> None:
     async with clients_lock:
         if not connected_clients:
             return
+        payload = (message + "\n").encode(errors="ignore")   # same bytes for every client
         dead_clients = []
         for w in connected_clients:
             try:
-                w.write((message + "\n").encode(errors="ignore"))
+                w.write(payload)
             except Exception:
                 dead_clients.append(w)
 
@@ -110,28 +115,35 @@ async def broadcast_to_clients(message: str) -> None:
 def parse_dx_line(line: str):
     """
     Parsed the line from the cluster:
-        DX DE {FROM} {FREQ} {CALLSIGN} {MODE} ...
-    using spaces or tabs as separators.
+        DX DE {FROM}: {FREQ} {CALLSIGN} {MODE} {SNR} dB {SPEED} WPM {ACTIVITY} {TIME}
+    using spaces or tabs as separators; fields are returned in uppercase.
     """
-    # Split according with separator
-    tokens = re.split(r'\s+', line.strip())
-    if len(tokens) < 6:
-        return None
-
-    if tokens[0].upper() != "DX" or tokens[1].upper() != "DE":
+    m = _DX_LINE.match(line.upper())
+    if m is None:
         return None
-
-    from_ = tokens[2].upper()
-    freq = tokens[3].upper()
-    callsign = tokens[4].upper()
-    mode = tokens[5].upper()
-    speed = tokens[8].upper()
-    snr=tokens[6].upper()
-    activity=tokens[10].upper()
-    timestamp=tokens[11].upper()
+    from_, freq, callsign, mode, snr, speed, activity, timestamp = m.groups()
     return from_, freq, callsign, mode,speed,snr,activity,timestamp
 
 
+#*-----------------------------------------------------------------------------------------------------------
+#* Lines from the cluster, read in bulk (READ_CHUNK bytes per call) and split locally rather than resuming
+#* the reader once per line; a partial trailing line is kept for the next read
+#*-----------------------------------------------------------------------------------------------------------
+READ_CHUNK=65536
+
+async def read_lines(reader: asyncio.StreamReader):
+    buf = b""
+    while True:
+        chunk = await reader.read(READ_CHUNK)
+        if not chunk:
+            if buf:
+                yield buf
+            print("[REMOTE] Remote connection closed.", file=sys.stderr)
+            return
+        *lines, buf = (buf + chunk).split(b"\n")
+        for data in lines:
+            yield data
+
 async def remote_client_task(host: str,
                              port: int,
                              keyword: str,
@@ -173,15 +185,12 @@ async def remote_client_task(host: str,
 
     print("[REMOTE] Handshake completed, processing spots ...", file=sys.stderr)
 
-    # Main loop receive, process and filter spots
+    # Main loop receive, process and filter spots, parse_dx_line already returns the fields in uppercase
 
-    try:
-        while True:
-            data = await reader.readline()
-            if not data:
-                print("[REMOTE] Remote connection closed.", file=sys.stderr)
-                break
+    filter_u = filter_callsign.upper()
 
+    try:
+        async for data in read_lines(reader):
             line = data.decode(errors="ignore").rstrip("\r\n")
             # Parse spot 
             parsed = parse_dx_line(line)
@@ -192,7 +201,7 @@ async def remote_client_task(host: str,
             from_, freq, callsign, mode, speed, snr, activity, timestamp = parsed
 
             # Filter callsign
-            if filter_callsign != "*" and callsign.upper() != filter_callsign.upper():
+            if filter_callsign != "*" and callsign != filter_u:
                 continue
 
             # If pass the filter show at stdout and send to clients